@@ -0,0 +1,127 @@
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+DEFAULT_CACHE_SIZE = 1024
+
+_stale_reads: ContextVar[list[str] | None] = ContextVar("stale_reads", default=None)
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a per-entry time-to-live.
+
+    Entries are evicted oldest-first once the cache holds `maxsize` entries.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for a key, or None if it is missing or expired.
+
+        Args:
+            key: The cache key
+        Returns:
+            The cached value, if still fresh
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value for the given number of seconds.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: How long the value stays fresh, in seconds
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one call whose outcome every caller receives."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do[T](self, key: Hashable, func: Callable[[], T]) -> T:
+        """Call func, or wait for the call already in flight for the same key.
+
+        Args:
+            key: Identifies calls that would return the same result
+            func: The call to make if none is in flight for the key
+        Returns:
+            The result of the call, shared with every concurrent caller using the same key
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            in_flight = future is not None
+            if not in_flight:
+                future = self._calls[key] = Future()
+        if in_flight:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+@contextmanager
+def track_stale_reads() -> Iterator[list[str]]:
+    """Collect the URLs of reads that were answered from a stale cache entry inside the block.
+
+    Yields:
+        The list that stale reads are appended to
+    """
+    stale_reads: list[str] = []
+    token = _stale_reads.set(stale_reads)
+    try:
+        yield stale_reads
+    finally:
+        _stale_reads.reset(token)
+
+
+def record_stale_read(url: str) -> None:
+    """Note that a read was answered from a stale cache entry, if stale reads are being tracked.
+
+    Args:
+        url: The URL of the read
+    """
+    stale_reads = _stale_reads.get()
+    if stale_reads is not None:
+        stale_reads.append(url)
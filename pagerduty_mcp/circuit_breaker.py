@@ -0,0 +1,64 @@
+import threading
+import time
+
+DEFAULT_FAILURE_THRESHOLD = 10
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker that stops calls to a failing dependency for a while.
+
+    After `failure_threshold` consecutive failures the circuit opens and `allow()` refuses calls
+    for `reset_timeout` seconds. Once that has passed a single trial call is let through: success
+    closes the circuit again, failure re-opens it.
+    """
+
+    def __init__(
+        self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a call may be made now.
+
+        Returns:
+            False while the circuit is open, True otherwise
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Note a successful call, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Note a failed call, opening the circuit once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def retry_after(self) -> float:
+        """Return how many seconds remain until the open circuit lets a trial call through.
+
+        Returns:
+            The remaining seconds, or 0 if the circuit is closed
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._reset_timeout - (time.monotonic() - self._opened_at))
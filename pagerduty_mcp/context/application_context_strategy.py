@@ -1,19 +1,237 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
+import copy
+import functools
+import json
 import os
 
 from importlib import metadata
+from pagerduty import Error, HttpError, UrlError
 from pagerduty.rest_api_v2_client import RestApiV2Client
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 from pagerduty_mcp import DIST_NAME
+from pagerduty_mcp.cache import SingleFlight, TTLCache, record_stale_read
+from pagerduty_mcp.circuit_breaker import CircuitBreaker
 from pagerduty_mcp.context.mcp_context import MCPContext
 from pagerduty_mcp.context.context_strategy import ContextStrategy
 
+# Tools run on worker threads (see pagerduty_mcp.server), so size the keep-alive pool to the
+# default worker thread limit; otherwise concurrent calls overflow the pool and reconnect.
+CONNECTION_POOL_SIZE = 40
+
+
+# Seconds to reuse a successful GET response, keyed by canonical API path. Any write made
+# through the client clears the cache, so only changes made elsewhere can be served stale.
+RESPONSE_CACHE_TTLS: dict[str, float] = {
+    "/users/me": 60,
+    "/teams": 15,
+    "/teams/{id}": 15,
+    "/escalation_policies": 15,
+    "/schedules": 15,
+    "/oncalls": 15,
+    "/services": 15,
+    # Account-wide reference data that is rarely edited.
+    "/priorities": 3600,
+    # Incidents change during triage, so repeat lookups are only reused briefly, and they are
+    # deliberately left out of STALE_FALLBACK_PATHS.
+    "/incidents/{id}": 15,
+    # By-ID lookups of resources that rarely change once created. Routers are left out because
+    # append_event_orchestration_router_rule reads one to write it back.
+    "/change_events/{id}": 60,
+    "/event_orchestrations/{id}": 60,
+    "/event_orchestrations/{id}/global": 60,
+    "/incident_workflows/{id}": 60,
+    # Status page configuration is rarely edited; posts are reused only briefly while an update is drafted.
+    "/status_pages": 60,
+    "/status_pages/{id}/severities": 60,
+    "/status_pages/{id}/impacts": 60,
+    "/status_pages/{id}/statuses": 60,
+    "/status_pages/{id}/posts/{post_id}": 5,
+    # Not a path the SDK knows, so it is matched exactly (see _cache_path).
+    "/v3/schedules": 15,
+}
+
+# Endpoints whose results change too often to reuse without asking, but whose reads still send
+# conditional requests (see _conditional_headers) so an unchanged result is not downloaded again.
+REVALIDATED_PATHS = frozenset({"/incidents", "/log_entries"})
+
+# List endpoints whose reads fall back to their last successful response while the API is
+# unavailable. Only list tools report staleness (ListResponseModel.is_stale), so single-entity
+# lookups such as incidents are never answered with an unmarked stale copy.
+STALE_FALLBACK_PATHS = frozenset(
+    {"/escalation_policies", "/oncalls", "/schedules", "/services", "/teams", "/v3/schedules"}
+)
+
+# Statuses for which a cacheable read falls back to its last successful response, if there is one.
+STALE_FALLBACK_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Seconds a successful response is kept for the stale fallback and for conditional requests.
+STALE_FALLBACK_MAX_AGE = 600
+
+# Times a rate-limited read that can fall back to a stale response is retried before the 429 is
+# returned. The SDK otherwise retries 429s without limit, so the read would never reach the fallback;
+# every other request keeps retrying until it is no longer rate limited.
+RATE_LIMIT_RETRIES = 3
+
+# Set while a read that can fall back to a stale response is in flight on the current thread.
+_limit_rate_limit_retries: ContextVar[bool] = ContextVar("limit_rate_limit_retries", default=False)
+
+# Statuses that count as the API failing, towards opening the client's circuit breaker.
+CIRCUIT_BREAKER_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(Error):
+    """Raised instead of calling the API while repeated failures have opened the circuit breaker."""
+
 
 class PagerdutyMCPClient(RestApiV2Client):
+    def __init__(self, api_key: str, *args, **kwargs):
+        super().__init__(api_key, *args, **kwargs)
+        self.response_cache = TTLCache()
+        # Last successful response per cacheable read, kept past its TTL to revalidate it and, for
+        # STALE_FALLBACK_PATHS, to serve while the API is unavailable.
+        self.last_good_responses = TTLCache()
+        # Concurrent identical cacheable reads share one API call instead of each making their own.
+        self.inflight_reads = SingleFlight()
+        # Stops calling the API for a while once it keeps failing, instead of piling on retries.
+        self.circuit_breaker = CircuitBreaker()
+
+    @property
+    def retry(self) -> dict[int, int]:
+        """Retry rules per HTTP status, used by the SDK's request loop."""
+        if _limit_rate_limit_retries.get():
+            return {**self._retry, 429: RATE_LIMIT_RETRIES}
+        return self._retry
+
+    @retry.setter
+    def retry(self, value: dict[int, int]) -> None:
+        self._retry = value
+
     @property
     def user_agent(self) -> str:
         return f"{DIST_NAME}/{metadata.version(DIST_NAME)} {super().user_agent}"
 
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Make an API request, reusing recent responses for cacheable reads.
+
+        Reads of cacheable paths and REVALIDATED_PATHS send the validators of their last successful
+        response, and reuse it if the API reports it unchanged.
+        If a read of one of the STALE_FALLBACK_PATHS is rate limited, fails with a server error or
+        cannot reach the API, its last successful response is returned instead, marked with an
+        `X-Stale` header. Once the API keeps failing, requests raise CircuitOpenError for a while
+        without calling it (those reads still fall back to their last successful response).
+        """
+        if method.strip().upper() != "GET":
+            try:
+                return self._send(method, url, **kwargs)
+            finally:
+                # Any write may change what previously cached reads would return.
+                self.response_cache.clear()
+                self.last_good_responses.clear()
+
+        path = self._cache_path(url)
+        ttl = RESPONSE_CACHE_TTLS.get(path)
+        if ttl is None and path not in REVALIDATED_PATHS:
+            return self._send(method, url, **kwargs)
+
+        key = (self.normalize_url(url), json.dumps(kwargs.get("params"), sort_keys=True, default=str))
+        response = self.response_cache.get(key) if ttl is not None else None
+        if response is None:
+            stale_fallback = path in STALE_FALLBACK_PATHS
+            fetch = functools.partial(
+                self._fetch_cacheable, key, ttl, method, url, stale_fallback=stale_fallback, **kwargs
+            )
+            response = self.inflight_reads.do(key, fetch)
+        if response.headers.get("X-Stale") == "true":
+            record_stale_read(key[0])
+        return response
+
+    def _fetch_cacheable(
+        self, key: tuple[str, str], ttl: float | None, method: str, url: str, *, stale_fallback: bool, **kwargs
+    ) -> Response:
+        last_good_response = self.last_good_responses.get(key)
+        validators = _conditional_headers(last_good_response) if last_good_response is not None else {}
+        if validators:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        # Only a read with a response to fall back to gives up on rate limiting early.
+        token = _limit_rate_limit_retries.set(stale_fallback and last_good_response is not None)
+        try:
+            response = self._send(method, url, **kwargs)
+        except HttpError:
+            # The API answered (e.g. 401 Unauthorized), so serving a stale copy would hide the error.
+            raise
+        except Error:
+            stale_response = self._stale_response(key) if stale_fallback else None
+            if stale_response is None:
+                raise
+            return stale_response
+        finally:
+            _limit_rate_limit_retries.reset(token)
+
+        if response.status_code == 304 and validators:
+            # Unchanged since the last successful read, so its body is still current.
+            response = last_good_response
+        if response.ok:
+            if ttl is not None:
+                self.response_cache.set(key, response, ttl)
+            self.last_good_responses.set(key, response, STALE_FALLBACK_MAX_AGE)
+        elif stale_fallback and response.status_code in STALE_FALLBACK_STATUSES:
+            stale_response = self._stale_response(key)
+            if stale_response is not None:
+                return stale_response
+        return response
+
+    def _send(self, method: str, url: str, **kwargs) -> Response:
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError(
+                f"{method.upper()} {url}: the PagerDuty API has been failing repeatedly; "
+                f"not calling it again for {self.circuit_breaker.retry_after():.0f} seconds."
+            )
+
+        failed = True
+        try:
+            response = super().request(method, url, **kwargs)
+            failed = response.status_code in CIRCUIT_BREAKER_STATUSES
+            return response
+        except HttpError:
+            # The API answered (e.g. 401 Unauthorized), so it is not unavailable.
+            failed = False
+            raise
+        finally:
+            if failed:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+    def _stale_response(self, key: tuple[str, str]) -> Response | None:
+        response = self.last_good_responses.get(key)
+        if response is None:
+            return None
+        stale_response = copy.copy(response)
+        stale_response.headers = CaseInsensitiveDict(response.headers)
+        stale_response.headers["X-Stale"] = "true"
+        return stale_response
+
+    def _cache_path(self, url: str) -> str:
+        try:
+            return self.canonical_path(url)
+        except UrlError:
+            return self.normalize_url(url).removeprefix(self.url)
+
+
+def _conditional_headers(response: Response) -> dict[str, str]:
+    """Build the headers that revalidate a previous response instead of downloading it again."""
+    headers = {}
+    if "ETag" in response.headers:
+        headers["If-None-Match"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
+
 
 def create_pd_client() -> RestApiV2Client:
     """Create a PagerDuty client."""
@@ -26,6 +244,10 @@ def create_pd_client() -> RestApiV2Client:
     pd_client = PagerdutyMCPClient(api_key)
     if api_host:
         pd_client.url = api_host
+
+    adapter = HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE)
+    pd_client.mount("https://", adapter)
+    pd_client.mount("http://", adapter)
     return pd_client
 
 
@@ -19,7 +19,7 @@ class MCPContext:
         """Set the user associated with the client credentials."""
         try:
             response = self.client.rget("/users/me")
-            if type(response) is not dict:
+            if not isinstance(response, dict):
                 logging.warning(f"Unexpected response type when initializing user: {type(response)}")
                 return None
 
@@ -10,7 +10,7 @@ from .alert_grouping_settings import (
     TimeGroupingConfig,
 )
 from .alerts import Alert, AlertQuery
-from .base import MAX_RESULTS, ListResponseModel
+from .base import MAX_RESULTS, BulkLookupFailure, BulkLookupResponse, ListResponseModel
 from .change_events import ChangeEvent, ChangeEventQuery
 from .escalation_policies import EscalationPolicy, EscalationPolicyCreate, EscalationPolicyQuery, EscalationPolicyUpdate
 from .event_orchestrations import (
@@ -133,7 +133,7 @@ from .status_pages import (
     StatusPageStatusQuery,
     StatusPageStatusReference,
 )
-from .teams import Team, TeamCreateRequest, TeamMemberAdd, TeamQuery
+from .teams import Team, TeamCreateRequest, TeamMemberAdd, TeamMemberFailure, TeamMembersBulkResult, TeamQuery
 from .users import CreateUserRequest, User, UserQuery
 from .webhooks import ExtensionSchema, WebhookCreate, WebhookSubscription, WebhookUpdate
 
@@ -152,6 +152,8 @@ __all__ = [
     "AlertGroupingSettingUpdateRequest",
     "Assignment",
     "AssignmentInput",
+    "BulkLookupFailure",
+    "BulkLookupResponse",
     "ChangeEvent",
     "ChangeEventQuery",
     "ContentBasedConfig",
@@ -254,6 +256,8 @@ __all__ = [
     "Team",
     "TeamCreateRequest",
     "TeamMemberAdd",
+    "TeamMemberFailure",
+    "TeamMembersBulkResult",
     "TeamQuery",
     "TeamReference",
     "TimeGroupingConfig",
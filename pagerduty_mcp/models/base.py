@@ -1,12 +1,14 @@
 from typing import Literal, TypeVar
 
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, Field, computed_field
 
 RequestScope = Literal["all", "my"]
 
 DEFAULT_PAGINATION_LIMIT = 20
 MAXIMUM_PAGINATION_LIMIT = 100
 MAX_RESULTS = 1000
+# Most entities a bulk lookup tool retrieves in one call, so one call cannot fan out unboundedly.
+MAX_BULK_LOOKUP_IDS = 50
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -20,6 +22,10 @@ class ListResponseModel[T: BaseModel](BaseModel):
     """
 
     response: list[T]
+    is_stale: bool = Field(
+        default=False,
+        description="True if PagerDuty was unavailable and the response was served from an earlier cached result",
+    )
 
     @computed_field
     @property
@@ -43,4 +49,36 @@ class ListResponseModel[T: BaseModel](BaseModel):
                 "- WARNING: The number of records equals the response limit. There may be more"
                 " records not included in this response."
             )
+        if self.is_stale:
+            summary.append(
+                "- NOTE: PagerDuty could not be reached or is rate limiting requests, so this response"
+                " was served from an earlier cached result and may be out of date."
+            )
         return "\n".join(summary)
+
+
+class BulkLookupFailure(BaseModel):
+    id: str = Field(description="The ID that could not be retrieved")
+    reason: str = Field(description="Why the lookup failed")
+
+
+class BulkLookupResponse[T: BaseModel](ListResponseModel[T]):
+    """List response for a bulk lookup by ID.
+
+    `response` holds the entities that were retrieved; IDs that could not be retrieved (e.g. because
+    they do not exist) are reported in `failed` instead of failing the whole lookup.
+    """
+
+    failed: list[BulkLookupFailure] = Field(
+        default_factory=list, description="IDs that could not be retrieved, with the reason"
+    )
+
+    @computed_field
+    @property
+    def response_summary(self) -> str:
+        """Generate a summary of the response, including any IDs that could not be retrieved."""
+        summary = super().response_summary
+        if self.failed:
+            failed_ids = ", ".join(failure.id for failure in self.failed)
+            summary += f"\n- WARNING: {len(self.failed)} ID(s) could not be retrieved: {failed_ids}."
+        return summary
@@ -261,4 +261,6 @@ class SchedulesListResponse(ListResponseModel[ScheduleSummary]):
                 lines.append(f"- Note: more {label} schedules exist beyond the returned page.")
         if count >= MAX_RESULTS:
             lines.append("- WARNING: the number of records equals the response limit; there may be more not included.")
+        if self.is_stale:
+            lines.append("- NOTE: PagerDuty was unavailable, so this list was served from an earlier cached result.")
         return "\n".join(lines)
@@ -75,3 +75,19 @@ class TeamMemberAdd(BaseModel):
         default="manager",
         description="The role of the user in the team",
     )
+
+
+class TeamMemberFailure(BaseModel):
+    user_id: str = Field(description="The ID of the user whose membership change failed")
+    reason: str = Field(description="Why the membership change failed")
+
+
+class TeamMembersBulkResult(BaseModel):
+    """Per-user outcome of a bulk team membership change."""
+
+    successful: list[str] = Field(
+        default_factory=list, description="IDs of the users whose membership change succeeded"
+    )
+    failed: list[TeamMemberFailure] = Field(
+        default_factory=list, description="Users whose membership change failed, with the reason"
+    )
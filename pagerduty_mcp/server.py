@@ -1,16 +1,20 @@
+import functools
 import ipaddress
 import logging
 from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
+import anyio.to_thread
 import typer
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.types import ToolAnnotations
 
+from pagerduty_mcp.cache import track_stale_reads
 from pagerduty_mcp.context import ContextResolver
 from pagerduty_mcp.context.application_context_strategy import ApplicationContextStrategy
+from pagerduty_mcp.models import ListResponseModel
 from pagerduty_mcp.tools import read_tools, write_tools
 
 
@@ -38,6 +42,30 @@ live environment. Always confirm with the user before using any tool marked as d
 """
 
 
+def run_in_worker_thread(tool: Callable) -> Callable:
+    """Wrap a blocking tool so it runs on a worker thread instead of the event loop.
+
+    FastMCP calls synchronous tools directly on the event loop, so a single slow PagerDuty
+    API call would stall every other in-flight request. The wrapper keeps the tool's name,
+    docstring and signature so the generated tool schema is unchanged.
+
+    Args:
+        tool: The tool function to wrap
+    Returns:
+        An async function that awaits the tool on a worker thread
+    """
+
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        with track_stale_reads() as stale_reads:
+            result = await anyio.to_thread.run_sync(functools.partial(tool, *args, **kwargs))
+        if stale_reads and isinstance(result, ListResponseModel):
+            result = result.model_copy(update={"is_stale": True})
+        return result
+
+    return wrapper
+
+
 def add_read_only_tool(mcp_instance: FastMCP, tool: Callable) -> None:
     """Add a read-only tool with appropriate safety annotations.
 
@@ -46,7 +74,7 @@ def add_read_only_tool(mcp_instance: FastMCP, tool: Callable) -> None:
         tool: The tool function to add
     """
     mcp_instance.add_tool(
-        tool,
+        run_in_worker_thread(tool),
         annotations=ToolAnnotations(readOnlyHint=True, destructiveHint=False, idempotentHint=True),
     )
 
@@ -59,7 +87,7 @@ def add_write_tool(mcp_instance: FastMCP, tool: Callable) -> None:
         tool: The tool function to add
     """
     mcp_instance.add_tool(
-        tool,
+        run_in_worker_thread(tool),
         annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True, idempotentHint=False),
     )
 
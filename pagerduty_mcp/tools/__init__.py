@@ -23,6 +23,7 @@ from .business_services import (
 from .priorities import list_priorities
 from .change_events import (
     get_change_event,
+    get_change_events_bulk,
     list_change_events,
     list_incident_change_events,
     list_service_change_events,
@@ -53,6 +54,7 @@ from .incidents import (
     add_responders,
     create_incident,
     get_incident,
+    get_incidents_bulk,
     get_outlier_incident,
     get_past_incidents,
     get_related_incidents,
@@ -98,6 +100,7 @@ from .schedules_v3 import (
 from .services import (
     create_service,
     get_service,
+    get_services_bulk,
     get_technical_service_dependencies,
     list_services,
     update_service,
@@ -114,12 +117,14 @@ from .status_pages import (
 )
 from .teams import (
     add_team_member,
+    add_team_members_bulk,
     create_team,
     delete_team,
     get_team,
     list_team_members,
     list_teams,
     remove_team_member,
+    remove_team_members_bulk,
     update_team,
 )
 from .users import create_user, get_user_data, list_users
@@ -134,7 +139,7 @@ from .webhooks import (
 )
 
 # Read-only tools (safe, non-destructive operations)
-read_tools = [
+read_tools = (
     # Alert Grouping Settings
     list_alert_grouping_settings,
     get_alert_grouping_setting,
@@ -144,11 +149,13 @@ read_tools = [
     # Change Events
     list_change_events,
     get_change_event,
+    get_change_events_bulk,
     list_service_change_events,
     list_incident_change_events,
     # Incidents
     list_incidents,
     get_incident,
+    get_incidents_bulk,
     get_outlier_incident,
     get_past_incidents,
     get_related_incidents,
@@ -159,6 +166,7 @@ read_tools = [
     # Services
     list_services,
     get_service,
+    get_services_bulk,
     get_technical_service_dependencies,
     # Teams
     list_teams,
@@ -218,10 +226,10 @@ read_tools = [
     # Extension Schemas
     list_extension_schemas,
     get_extension_schema,
-]
+)
 
 # Write tools (potentially dangerous operations that modify state)
-write_tools = [
+write_tools = (
     # Alert Grouping Settings
     create_alert_grouping_setting,
     update_alert_grouping_setting,
@@ -242,6 +250,8 @@ write_tools = [
     delete_team,
     add_team_member,
     remove_team_member,
+    add_team_members_bulk,
+    remove_team_members_bulk,
     # Schedules (unified): create/update target shift-based (v3); overrides are layer-based (v2)
     create_schedule,
     update_schedule,
@@ -274,7 +284,7 @@ write_tools = [
     create_webhook_subscription,
     update_webhook_subscription,
     delete_webhook_subscription,
-]
+)
 
-# All tools (combined list for backward compatibility)
-all_tools = read_tools + write_tools
+# All tools (combined for backward compatibility)
+all_tools = (*read_tools, *write_tools)
@@ -1,9 +1,14 @@
 from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
-from pagerduty_mcp.models import ChangeEvent, ListResponseModel
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.models import BulkLookupResponse, ChangeEvent, ListResponseModel
+from pagerduty_mcp.utils import enveloped_entity_adapter, lookup_by_ids, paginate
+
+_CHANGE_EVENT_LIST_ADAPTER = TypeAdapter(list[ChangeEvent])
+_CHANGE_EVENT_RESPONSE_ADAPTER = enveloped_entity_adapter(ChangeEvent, "change_event")
 
 
 def list_change_events(
@@ -54,7 +59,7 @@ def list_change_events(
         params=params,
         maximum_records=limit or 100,
     )
-    change_events = [ChangeEvent(**change_event) for change_event in response]
+    change_events = _CHANGE_EVENT_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[ChangeEvent](response=change_events)
 
 
@@ -68,12 +73,23 @@ def get_change_event(change_event_id: str) -> ChangeEvent:
         ChangeEvent details
     """
     response = get_client().rget(f"/change_events/{change_event_id}")
+    return _CHANGE_EVENT_RESPONSE_ADAPTER.validate_python(response)
+
+
+def get_change_events_bulk(change_event_ids: list[str]) -> BulkLookupResponse[ChangeEvent]:
+    """Get details about several change events at once.
 
-    # Handle wrapped response
-    if isinstance(response, dict) and "change_event" in response:
-        return ChangeEvent.model_validate(response["change_event"])
+    Use this instead of calling get_change_event repeatedly, e.g. for the change events
+    returned by list_incident_change_events. At most 50 change events can be retrieved per call.
 
-    return ChangeEvent.model_validate(response)
+    Args:
+        change_event_ids: The IDs of the change events to retrieve
+
+    Returns:
+        The change events that were retrieved, in the order their IDs were given, and the IDs
+        that could not be retrieved, with the reason
+    """
+    return lookup_by_ids(ChangeEvent, get_change_event, change_event_ids)
 
 
 def list_service_change_events(
@@ -123,7 +139,7 @@ def list_service_change_events(
         params=params,
         maximum_records=limit or 100,
     )
-    change_events = [ChangeEvent(**change_event) for change_event in response]
+    change_events = _CHANGE_EVENT_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[ChangeEvent](response=change_events)
 
 
@@ -147,5 +163,5 @@ def list_incident_change_events(incident_id: str, limit: int | None = None) -> L
         params=params,
         maximum_records=limit or 100,
     )
-    change_events = [ChangeEvent(**change_event) for change_event in response]
+    change_events = _CHANGE_EVENT_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[ChangeEvent](response=change_events)
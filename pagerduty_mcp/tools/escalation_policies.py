@@ -1,8 +1,13 @@
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import EscalationPolicy, EscalationPolicyCreate, EscalationPolicyUpdate, ListResponseModel
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import enveloped_entity_adapter, iter_pages
+
+_ESCALATION_POLICY_LIST_ADAPTER = TypeAdapter(list[EscalationPolicy])
+_ESCALATION_POLICY_RESPONSE_ADAPTER = enveloped_entity_adapter(EscalationPolicy, "escalation_policy")
 
 
 def list_escalation_policies(
@@ -35,8 +40,8 @@ def list_escalation_policies(
         params["include[]"] = include
     if limit:
         params["limit"] = limit
-    response = paginate(client=get_client(), entity="escalation_policies", params=params)
-    policies = [EscalationPolicy(**policy) for policy in response]
+    pages = iter_pages(client=get_client(), entity="escalation_policies", params=params)
+    policies = [policy for page in pages for policy in _ESCALATION_POLICY_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[EscalationPolicy](response=policies)
 
 
@@ -65,11 +70,7 @@ def create_escalation_policy(escalation_policy_data: EscalationPolicyCreate) ->
         The created escalation policy
     """
     response = get_client().rpost("/escalation_policies", json=escalation_policy_data.model_dump(exclude_unset=True))
-
-    if type(response) is dict and "escalation_policy" in response:
-        return EscalationPolicy.model_validate(response["escalation_policy"])
-
-    return EscalationPolicy.model_validate(response)
+    return _ESCALATION_POLICY_RESPONSE_ADAPTER.validate_python(response)
 
 
 def update_escalation_policy(policy_id: str, escalation_policy_data: EscalationPolicyUpdate) -> EscalationPolicy:
@@ -83,8 +84,4 @@ def update_escalation_policy(policy_id: str, escalation_policy_data: EscalationP
         The updated escalation policy
     """
     response = get_client().rput(f"/escalation_policies/{policy_id}", json=escalation_policy_data.model_dump(exclude_unset=True))
-
-    if type(response) is dict and "escalation_policy" in response:
-        return EscalationPolicy.model_validate(response["escalation_policy"])
-
-    return EscalationPolicy.model_validate(response)
+    return _ESCALATION_POLICY_RESPONSE_ADAPTER.validate_python(response)
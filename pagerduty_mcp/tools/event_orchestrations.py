@@ -1,5 +1,7 @@
 from typing import Any, Literal
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import (
     EventOrchestration,
@@ -10,7 +12,10 @@ from pagerduty_mcp.models import (
     EventOrchestrationService,
     ListResponseModel,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import enveloped_entity_adapter, paginate
+
+_EVENT_ORCHESTRATION_LIST_ADAPTER = TypeAdapter(list[EventOrchestration])
+_EVENT_ORCHESTRATION_RESPONSE_ADAPTER = enveloped_entity_adapter(EventOrchestration, "orchestration")
 
 
 def list_event_orchestrations(
@@ -46,7 +51,7 @@ def list_event_orchestrations(
         params=params,
         maximum_records=limit or 1000,
     )
-    orchestrations = [EventOrchestration(**orchestration) for orchestration in response]
+    orchestrations = _EVENT_ORCHESTRATION_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[EventOrchestration](response=orchestrations)
 
 
@@ -60,11 +65,7 @@ def get_event_orchestration(orchestration_id: str) -> EventOrchestration:
         The event orchestration details
     """
     response = get_client().rget(f"/event_orchestrations/{orchestration_id}")
-
-    if isinstance(response, dict) and "orchestration" in response:
-        return EventOrchestration.model_validate(response["orchestration"])
-
-    return EventOrchestration.model_validate(response)
+    return _EVENT_ORCHESTRATION_RESPONSE_ADAPTER.validate_python(response)
 
 
 def get_event_orchestration_router(orchestration_id: str) -> EventOrchestrationRouter:
@@ -120,20 +121,17 @@ def append_event_orchestration_router_rule(
     if not current_router.orchestration_path or not current_router.orchestration_path.sets:
         raise ValueError(f"Event orchestration {orchestration_id} has no valid router configuration")
 
-    rule_set = current_router.orchestration_path.sets[0]
+    current_path = current_router.orchestration_path
+    rule_set = current_path.sets[0]
 
     new_rule_data = new_rule.model_dump()
     new_rule_data["id"] = "temp_id_will_be_replaced_by_api"
     new_rule_obj = EventOrchestrationRule.model_validate(new_rule_data)
 
-    updated_rules = list(rule_set.rules) if rule_set.rules else []
-    updated_rules.append(new_rule_obj)
-
-    updated_rule_set = rule_set.model_copy()
-    updated_rule_set.rules = updated_rules
-
-    updated_path = current_router.orchestration_path.model_copy()
-    updated_path.sets = [updated_rule_set]
+    # The router was just fetched for this update, so shallow copies that replace only the
+    # changed fields are enough; the existing rules are shared, not copied.
+    updated_rule_set = rule_set.model_copy(update={"rules": [*(rule_set.rules or []), new_rule_obj]})
+    updated_path = current_path.model_copy(update={"sets": [updated_rule_set]})
 
     update_request = EventOrchestrationRouterUpdateRequest.from_path(updated_path)
 
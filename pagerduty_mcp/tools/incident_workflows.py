@@ -1,5 +1,7 @@
 from typing import Any, Literal
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import (
     IncidentWorkflow,
@@ -7,7 +9,10 @@ from pagerduty_mcp.models import (
     IncidentWorkflowInstanceRequest,
     ListResponseModel,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import enveloped_entity_adapter, paginate
+
+_INCIDENT_WORKFLOW_LIST_ADAPTER = TypeAdapter(list[IncidentWorkflow])
+_INCIDENT_WORKFLOW_RESPONSE_ADAPTER = enveloped_entity_adapter(IncidentWorkflow, "incident_workflow")
 
 
 def list_incident_workflows(
@@ -40,7 +45,7 @@ def list_incident_workflows(
         maximum_records=limit or 100,
     )
 
-    workflows = [IncidentWorkflow(**item) for item in response]
+    workflows = _INCIDENT_WORKFLOW_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[IncidentWorkflow](response=workflows)
 
 
@@ -54,11 +59,7 @@ def get_incident_workflow(workflow_id: str) -> IncidentWorkflow:
         IncidentWorkflow details
     """
     response = get_client().rget(f"/incident_workflows/{workflow_id}")
-
-    if isinstance(response, dict) and "incident_workflow" in response:
-        return IncidentWorkflow.model_validate(response["incident_workflow"])
-
-    return IncidentWorkflow.model_validate(response)
+    return _INCIDENT_WORKFLOW_RESPONSE_ADAPTER.validate_python(response)
 
 
 def start_incident_workflow(
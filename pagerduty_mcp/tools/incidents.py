@@ -1,9 +1,12 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.context import ContextResolver
 from pagerduty_mcp.models import (
+    BulkLookupResponse,
     GetIncidentQuery,
     Incident,
     IncidentCreate,
@@ -21,7 +24,10 @@ from pagerduty_mcp.models import (
     UserReference,
 )
 from pagerduty_mcp.models.base import MAX_RESULTS
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import lookup_by_ids, paginate
+
+_INCIDENT_LIST_ADAPTER = TypeAdapter(list[Incident])
+_INCIDENT_NOTE_LIST_ADAPTER = TypeAdapter(list[IncidentNote])
 
 
 def list_incidents(
@@ -70,12 +76,15 @@ def list_incidents(
             params["user_ids[]"] = [user_data.id]
         elif request_scope == "teams":
             user_team_ids = [team.id for team in user_data.teams]
+            if not user_team_ids:
+                # An empty team_ids[] filter is dropped from the query and would match every incident.
+                return ListResponseModel[Incident](response=[])
             params["team_ids[]"] = user_team_ids
 
     response = paginate(
         client=ContextResolver.get_client(), entity="incidents", params=params, maximum_records=limit or MAX_RESULTS
     )
-    incidents = [Incident(**incident) for incident in response]
+    incidents = _INCIDENT_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[Incident](response=incidents)
 
 
@@ -94,6 +103,22 @@ def get_incident(incident_id: str, query_model: GetIncidentQuery | None = None)
     return Incident.model_validate(response)
 
 
+def get_incidents_bulk(incident_ids: list[str]) -> BulkLookupResponse[Incident]:
+    """Get several incidents at once.
+
+    Use this instead of calling get_incident repeatedly, e.g. to resolve the incidents
+    referenced by related or past incident results. At most 50 incidents can be retrieved per call.
+
+    Args:
+        incident_ids: The IDs or numbers of the incidents to retrieve
+
+    Returns:
+        The incidents that were retrieved, in the order their IDs were given, and the IDs that
+        could not be retrieved, with the reason
+    """
+    return lookup_by_ids(Incident, get_incident, incident_ids)
+
+
 def create_incident(incident: IncidentCreate) -> Incident:
     """Create an incident.
 
@@ -106,15 +131,7 @@ def create_incident(incident: IncidentCreate) -> Incident:
 
 
 def _generate_manage_request(incident_ids: list[str]):
-    incident_references = []
-    for incident_id in incident_ids:
-        incident_references.append(
-            {
-                "type": "incident_reference",
-                "id": incident_id,
-            }
-        )
-    return {"incidents": incident_references}
+    return {"incidents": [{"type": "incident_reference", "id": incident_id} for incident_id in incident_ids]}
 
 
 def _update_manage_request(request: dict, field_name: str, field_value: Any):
@@ -124,41 +141,16 @@ def _update_manage_request(request: dict, field_name: str, field_value: Any):
     return request
 
 
-def _reassign_incident(incident_ids: list[str], assignee: UserReference):
-    request_payload = _generate_manage_request(incident_ids)
-    assignment_data = [
+def _assignments(assignee: UserReference) -> list[dict[str, Any]]:
+    return [
         {
-            "at": datetime.now().isoformat(),
+            "at": datetime.now(UTC).isoformat(),
             "assignee": {
                 "type": "user_reference",
                 "id": assignee.id,
             },
         }
     ]
-    request_payload = _update_manage_request(request_payload, "assignments", assignment_data)
-
-    return get_client().rput("/incidents", json=request_payload)
-
-
-def _change_incident_status(incident_ids: list[str], status: str):
-    request_payload = _generate_manage_request(incident_ids)
-    request_payload = _update_manage_request(request_payload, "status", status)
-
-    return get_client().rput("/incidents", json=request_payload)
-
-
-def _change_incident_urgency(incident_ids: list[str], urgency: str):
-    request_payload = _generate_manage_request(incident_ids)
-    request_payload = _update_manage_request(request_payload, "urgency", urgency)
-
-    return get_client().rput("/incidents", json=request_payload)
-
-
-def _escalate_incident(incident_ids: list[str], level: int):
-    request_payload = _generate_manage_request(incident_ids)
-    request_payload = _update_manage_request(request_payload, "escalation_level", level)
-
-    return get_client().rput("/incidents", json=request_payload)
 
 
 # TODO: Currently only supporting managing a single incident at a time.
@@ -181,21 +173,26 @@ def manage_incidents(
     Returns:
         The updated incidents
     """
-    response = None
+    changes: dict[str, Any] = {}
     if manage_request.status:
-        response = _change_incident_status(manage_request.incident_ids, manage_request.status)
+        changes["status"] = manage_request.status
     if manage_request.urgency:
-        response = _change_incident_urgency(manage_request.incident_ids, manage_request.urgency)
+        changes["urgency"] = manage_request.urgency
     if manage_request.assignement:
-        response = _reassign_incident(manage_request.incident_ids, manage_request.assignement)
+        changes["assignments"] = _assignments(manage_request.assignement)
     if manage_request.escalation_level:
-        response = _escalate_incident(manage_request.incident_ids, manage_request.escalation_level)
+        changes["escalation_level"] = manage_request.escalation_level
+    if not changes:
+        return ListResponseModel[Incident](response=[])
 
-    # TODO: Reconsider approach - We're overwriting the response
-    if response:
-        incidents = [Incident(**incident) for incident in response]
-        return ListResponseModel[Incident](response=incidents)
-    return ListResponseModel[Incident](response=[])
+    # All changes go into one request so the response reflects every applied field.
+    request_payload = _generate_manage_request(manage_request.incident_ids)
+    for field_name, field_value in changes.items():
+        request_payload = _update_manage_request(request_payload, field_name, field_value)
+
+    response = get_client().rput("/incidents", json=request_payload)
+    incidents = _INCIDENT_LIST_ADAPTER.validate_python(response)
+    return ListResponseModel[Incident](response=incidents)
 
 
 def add_responders(
@@ -218,7 +215,7 @@ def add_responders(
     payload["requester_id"] = user.id
 
     response = get_client().rpost(f"/incidents/{incident_id}/responder_requests", json=payload)
-    if type(response) is dict and "responder_request" in response:
+    if isinstance(response, dict) and "responder_request" in response:
         # If the response is a dict with a responder_request key, return the model
         return IncidentResponderRequestResponse.model_validate(response["responder_request"])
     return "Unexpected response format: " + str(response)
@@ -238,7 +235,7 @@ def list_incident_notes(incident_id: str) -> ListResponseModel[IncidentNote]:
 
     # The rget method returns the unwrapped data directly (array of notes)
     if isinstance(response, list):
-        notes = [IncidentNote.model_validate(note) for note in response]
+        notes = _INCIDENT_NOTE_LIST_ADAPTER.validate_python(response)
         return ListResponseModel[IncidentNote](response=notes)
 
     # Fallback if response format is unexpected
@@ -1,9 +1,13 @@
 from datetime import UTC, datetime, timedelta
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import ListResponseModel, LogEntry, LogEntryQuery
 from pagerduty_mcp.utils import paginate
 
+_LOG_ENTRY_LIST_ADAPTER = TypeAdapter(list[LogEntry])
+
 
 def get_log_entry(log_entry_id: str) -> LogEntry:
     """Get a specific log entry by ID.
@@ -36,10 +40,11 @@ def list_log_entries(query_model: LogEntryQuery | None = None) -> ListResponseMo
     if query_model is None:
         query_model = LogEntryQuery()
     # Default to last 7 days if no time range specified
+    now = datetime.now(UTC)
     if query_model.since is None:
-        query_model.since = datetime.now(UTC) - timedelta(days=7)
+        query_model.since = now - timedelta(days=7)
     if query_model.until is None:
-        query_model.until = datetime.now(UTC)
+        query_model.until = now
 
     params = query_model.to_params()
 
@@ -49,5 +54,5 @@ def list_log_entries(query_model: LogEntryQuery | None = None) -> ListResponseMo
         params=params,
         maximum_records=query_model.limit or 100,
     )
-    log_entries = [LogEntry(**entry) for entry in response]
+    log_entries = _LOG_ENTRY_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[LogEntry](response=log_entries)
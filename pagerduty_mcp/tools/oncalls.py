@@ -1,13 +1,17 @@
 from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import (
     ListResponseModel,
     Oncall,
     Service,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import iter_pages, run_concurrently
+
+_ONCALL_LIST_ADAPTER = TypeAdapter(list[Oncall])
 
 
 def list_oncalls(
@@ -58,15 +62,14 @@ def list_oncalls(
 
     # Resolve service_ids to escalation_policy_ids (not a native API parameter)
     if service_ids:
+        def resolve_escalation_policy_id(service_id: str) -> str:
+            service = Service.model_validate(client.rget(f"/services/{service_id}"))
+            return service.escalation_policy.id
+
         ep_ids = list(params.get("escalation_policy_ids[]", []))
-        for service_id in service_ids:
-            service_response = client.rget(f"/services/{service_id}")
-            service = Service.model_validate(service_response)
-            ep_ids.append(service.escalation_policy.id)
+        ep_ids.extend(run_concurrently(resolve_escalation_policy_id, service_ids))
         params["escalation_policy_ids[]"] = ep_ids
 
-    response = paginate(
-        client=client, entity="oncalls", params=params, maximum_records=limit or 1000
-    )
-    oncalls = [Oncall(**oncall) for oncall in response]
+    pages = iter_pages(client=client, entity="oncalls", params=params, maximum_records=limit or 1000)
+    oncalls = [oncall for page in pages for oncall in _ONCALL_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[Oncall](response=oncalls)
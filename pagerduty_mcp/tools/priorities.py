@@ -1,8 +1,12 @@
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import ListResponseModel
 from pagerduty_mcp.models.references import PriorityReference
 from pagerduty_mcp.utils import paginate
 
+_PRIORITY_LIST_ADAPTER = TypeAdapter(list[PriorityReference])
+
 
 def list_priorities() -> str:
     """List all priorities configured in the account.
@@ -17,5 +21,5 @@ def list_priorities() -> str:
         maximum_records=100,
     )
 
-    priorities = [PriorityReference(**priority) for priority in response]
+    priorities = _PRIORITY_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[PriorityReference](response=priorities).model_dump_json()
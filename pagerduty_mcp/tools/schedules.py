@@ -2,6 +2,7 @@ import logging
 from typing import Literal
 
 from pagerduty.errors import HttpError
+from pydantic import TypeAdapter
 
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import (
@@ -12,6 +13,7 @@ from pagerduty_mcp.models import (
     ScheduleQuery,
     SchedulesListResponse,
     ScheduleSummary,
+    ScheduleV3,
     ScheduleV3Create,
     ScheduleV3Update,
     SourceStatus,
@@ -23,7 +25,7 @@ from pagerduty_mcp.tools.schedules_v3 import (
     get_schedule_v3,
     update_schedule_v3,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import paginate, run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,8 @@ _V3_ENRICH_CAP = 50
 # specific message (not just the 400 status) means a genuine bad-request is never swallowed.
 _V3_REDIRECT_MARKERS = ("shift-based", "v3 schedules api", "/v3/schedules")
 
+_USER_LIST_ADAPTER = TypeAdapter(list[User])
+
 
 def _v2_summary(raw: dict) -> ScheduleSummary:
     return ScheduleSummary(
@@ -47,35 +51,40 @@ def _v2_summary(raw: dict) -> ScheduleSummary:
     )
 
 
+def _try_get_schedule_v3(schedule_id: str) -> ScheduleV3 | None:
+    try:
+        return get_schedule_v3(schedule_id)
+    except Exception as exc:  # noqa: BLE001 - one enrichment miss must not drop the item or fail the list
+        logger.warning("v3 schedule %s name enrichment failed: %s", schedule_id, exc)
+        return None
+
+
 def _list_v3_summaries(query_model: ScheduleQuery, *, enrich: bool) -> tuple[list[ScheduleSummary], bool, int]:
     """Return shift-based (v3) summaries, whether more pages exist, and how many names were left null.
 
     v3 LIST only supports name `query` and `limit`, so other v2 filters are not forwarded.
     """
     raw_refs, more = _get_v3_schedules_page(query=query_model.query, limit=query_model.limit)
+    refs = [ref for ref in raw_refs if ref.get("id")]
+
+    # Look the unnamed schedules up concurrently rather than one after another.
+    to_enrich = [ref["id"] for ref in refs if ref.get("name") is None][:_V3_ENRICH_CAP] if enrich else []
+    enriched = dict(zip(to_enrich, run_concurrently(_try_get_schedule_v3, to_enrich), strict=True))
 
     summaries: list[ScheduleSummary] = []
     unenriched = 0
-    enriched = 0
-    for ref in raw_refs:
-        schedule_id = ref.get("id")
-        if not schedule_id:
-            continue
+    for ref in refs:
+        schedule_id = ref["id"]
         name = ref.get("name")
         time_zone = ref.get("time_zone")
         html_url = ref.get("html_url")
 
         if name is None:
-            if enrich and enriched < _V3_ENRICH_CAP:
-                try:
-                    full = get_schedule_v3(schedule_id)
-                    name = full.name
-                    time_zone = time_zone or full.time_zone
-                    html_url = html_url or full.html_url
-                    enriched += 1
-                except Exception as exc:  # noqa: BLE001 - one enrichment miss must not drop the item or fail the list
-                    unenriched += 1
-                    logger.warning("v3 schedule %s name enrichment failed: %s", schedule_id, exc)
+            full = enriched.get(schedule_id)
+            if full is not None:
+                name = full.name
+                time_zone = time_zone or full.time_zone
+                html_url = html_url or full.html_url
             else:
                 unenriched += 1
 
@@ -224,10 +233,8 @@ def create_schedule_override(schedule_id: str, override_request: ScheduleOverrid
     Returns:
         The created schedule override
     """
-    request_data = override_request.model_dump()
+    request_data = override_request.model_dump(mode="json")
     for override in request_data["overrides"]:
-        override["start"] = override["start"].isoformat()
-        override["end"] = override["end"].isoformat()
         override["user"] = {"id": override.pop("user_id"), "type": "user_reference"}
 
     return get_client().rpost(f"/schedules/{schedule_id}/overrides", json=request_data)
@@ -243,5 +250,5 @@ def list_schedule_users(schedule_id: str) -> ListResponseModel[User]:
         List of users in the schedule
     """
     response = get_client().rget(f"/schedules/{schedule_id}/users")
-    users = [User(**user) for user in response]
+    users = _USER_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[User](response=users)
@@ -1,9 +1,14 @@
 import json
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
-from pagerduty_mcp.models import ListResponseModel, Service, ServiceCreate
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.models import BulkLookupResponse, ListResponseModel, Service, ServiceCreate
+from pagerduty_mcp.utils import enveloped_entity_adapter, iter_pages, lookup_by_ids
+
+_SERVICE_LIST_ADAPTER = TypeAdapter(list[Service])
+_SERVICE_RESPONSE_ADAPTER = enveloped_entity_adapter(Service, "service")
 
 
 def list_services(
@@ -28,8 +33,8 @@ def list_services(
         params["team_ids[]"] = teams_ids
     if limit:
         params["limit"] = limit
-    response = paginate(client=get_client(), entity="services", params=params)
-    services = [Service(**service) for service in response]
+    pages = iter_pages(client=get_client(), entity="services", params=params)
+    services = [service for page in pages for service in _SERVICE_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[Service](response=services)
 
 
@@ -46,6 +51,21 @@ def get_service(service_id: str) -> Service:
     return Service.model_validate(response)
 
 
+def get_services_bulk(service_ids: list[str]) -> BulkLookupResponse[Service]:
+    """Get details for several services at once.
+
+    Use this instead of calling get_service repeatedly. At most 50 services can be retrieved per call.
+
+    Args:
+        service_ids: The IDs of the services to retrieve
+
+    Returns:
+        The services that were retrieved, in the order their IDs were given, and the IDs that
+        could not be retrieved, with the reason
+    """
+    return lookup_by_ids(Service, get_service, service_ids)
+
+
 # TODO: Add deterministic check for summary field
 def create_service(service_data: ServiceCreate) -> Service:
     """Create a new service.
@@ -63,11 +83,7 @@ def create_service(service_data: ServiceCreate) -> Service:
         The created service
     """
     response = get_client().rpost("/services", json=service_data.model_dump())
-
-    if type(response) is dict and "service" in response:
-        return Service.model_validate(response["service"])
-
-    return Service.model_validate(response)
+    return _SERVICE_RESPONSE_ADAPTER.validate_python(response)
 
 
 def update_service(service_id: str, service_data: ServiceCreate) -> Service:
@@ -81,11 +97,7 @@ def update_service(service_id: str, service_data: ServiceCreate) -> Service:
         The updated service
     """
     response = get_client().rput(f"/services/{service_id}", json=service_data.model_dump())
-
-    if type(response) is dict and "service" in response:
-        return Service.model_validate(response["service"])
-
-    return Service.model_validate(response)
+    return _SERVICE_RESPONSE_ADAPTER.validate_python(response)
 
 
 def get_technical_service_dependencies(service_id: str) -> str:
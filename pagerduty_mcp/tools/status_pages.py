@@ -1,3 +1,5 @@
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import ListResponseModel
 from pagerduty_mcp.models.status_pages import (
@@ -16,7 +18,15 @@ from pagerduty_mcp.models.status_pages import (
     StatusPageStatus,
     StatusPageStatusQuery,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import enveloped_entity_adapter, iter_pages
+
+_STATUS_PAGE_LIST_ADAPTER = TypeAdapter(list[StatusPage])
+_SEVERITY_LIST_ADAPTER = TypeAdapter(list[StatusPageSeverity])
+_IMPACT_LIST_ADAPTER = TypeAdapter(list[StatusPageImpact])
+_STATUS_LIST_ADAPTER = TypeAdapter(list[StatusPageStatus])
+_POST_UPDATE_LIST_ADAPTER = TypeAdapter(list[StatusPagePostUpdate])
+_POST_RESPONSE_ADAPTER = enveloped_entity_adapter(StatusPagePost, "post")
+_POST_UPDATE_RESPONSE_ADAPTER = enveloped_entity_adapter(StatusPagePostUpdate, "post_update")
 
 
 def list_status_pages(query_model: StatusPageQuery | None = None) -> ListResponseModel[StatusPage]:
@@ -32,14 +42,13 @@ def list_status_pages(query_model: StatusPageQuery | None = None) -> ListRespons
         query_model = StatusPageQuery()
     params = query_model.to_params()
 
-    response = paginate(
+    pages = iter_pages(
         client=get_client(),
         entity="status_pages",
         params=params,
         maximum_records=query_model.limit or 100,
     )
-
-    status_pages = [StatusPage(**item) for item in response]
+    status_pages = [status_page for page in pages for status_page in _STATUS_PAGE_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[StatusPage](response=status_pages)
 
 
@@ -59,14 +68,13 @@ def list_status_page_severities(
         query_model = StatusPageSeverityQuery()
     params = query_model.to_params()
 
-    response = paginate(
+    pages = iter_pages(
         client=get_client(),
         entity=f"/status_pages/{status_page_id}/severities",
         params=params,
         maximum_records=query_model.limit or 100,
     )
-
-    severities = [StatusPageSeverity(**item) for item in response]
+    severities = [severity for page in pages for severity in _SEVERITY_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[StatusPageSeverity](response=severities)
 
 
@@ -86,14 +94,13 @@ def list_status_page_impacts(
         query_model = StatusPageImpactQuery()
     params = query_model.to_params()
 
-    response = paginate(
+    pages = iter_pages(
         client=get_client(),
         entity=f"/status_pages/{status_page_id}/impacts",
         params=params,
         maximum_records=query_model.limit or 100,
     )
-
-    impacts = [StatusPageImpact(**item) for item in response]
+    impacts = [impact for page in pages for impact in _IMPACT_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[StatusPageImpact](response=impacts)
 
 
@@ -113,14 +120,13 @@ def list_status_page_statuses(
         query_model = StatusPageStatusQuery()
     params = query_model.to_params()
 
-    response = paginate(
+    pages = iter_pages(
         client=get_client(),
         entity=f"/status_pages/{status_page_id}/statuses",
         params=params,
         maximum_records=query_model.limit or 100,
     )
-
-    statuses = [StatusPageStatus(**item) for item in response]
+    statuses = [status for page in pages for status in _STATUS_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[StatusPageStatus](response=statuses)
 
 
@@ -146,7 +152,7 @@ def create_status_page_post(status_page_id: str, create_model: StatusPagePostCre
         f"/status_pages/{status_page_id}/posts", json=create_model.model_dump(mode="json")
     )
 
-    return StatusPagePost.from_api_response(response)
+    return _POST_RESPONSE_ADAPTER.validate_python(response)
 
 
 def get_status_page_post(status_page_id: str, post_id: str, query_model: StatusPagePostQuery) -> StatusPagePost:
@@ -163,7 +169,7 @@ def get_status_page_post(status_page_id: str, post_id: str, query_model: StatusP
     params = query_model.to_params()
     response = get_client().rget(f"/status_pages/{status_page_id}/posts/{post_id}", params=params)
 
-    return StatusPagePost.from_api_response(response)
+    return _POST_RESPONSE_ADAPTER.validate_python(response)
 
 
 def create_status_page_post_update(
@@ -194,7 +200,7 @@ def create_status_page_post_update(
         json=create_model.model_dump(mode="json"),
     )
 
-    return StatusPagePostUpdate.from_api_response(response)
+    return _POST_UPDATE_RESPONSE_ADAPTER.validate_python(response)
 
 
 def list_status_page_post_updates(
@@ -214,12 +220,11 @@ def list_status_page_post_updates(
         query_model = StatusPagePostUpdateQuery()
     params = query_model.to_params()
 
-    response = paginate(
+    pages = iter_pages(
         client=get_client(),
         entity=f"/status_pages/{status_page_id}/posts/{post_id}/post_updates",
         params=params,
         maximum_records=query_model.limit or 100,
     )
-
-    post_updates = [StatusPagePostUpdate(**item) for item in response]
+    post_updates = [post_update for page in pages for post_update in _POST_UPDATE_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[StatusPagePostUpdate](response=post_updates)
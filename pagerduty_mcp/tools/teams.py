@@ -1,5 +1,9 @@
+from collections.abc import Callable
 from typing import Any
 
+from pydantic import TypeAdapter
+from requests import Response
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.context import ContextResolver
 from pagerduty_mcp.models import (
@@ -7,9 +11,21 @@ from pagerduty_mcp.models import (
     Team,
     TeamCreateRequest,
     TeamMemberAdd,
+    TeamMemberFailure,
+    TeamMembersBulkResult,
     UserReference,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import enveloped_entity_adapter, iter_pages, paginate, run_concurrently
+
+# Above this many team memberships, scanning all teams takes fewer requests than fetching each one.
+MAX_TEAM_LOOKUPS = 25
+
+# Most membership changes a bulk team tool sends in one call, so one call cannot fan out unboundedly.
+MAX_TEAM_MEMBER_CHANGES = 50
+
+_TEAM_LIST_ADAPTER = TypeAdapter(list[Team])
+_TEAM_RESPONSE_ADAPTER = enveloped_entity_adapter(Team, "team")
+_USER_REFERENCE_LIST_ADAPTER = TypeAdapter(list[UserReference])
 
 
 def list_teams(
@@ -37,22 +53,45 @@ def list_teams(
             )
 
         user_team_ids = [team.id for team in user_data.teams]
-        # Now get all team resources. Paginate limits to 1000 results by default
-        # TODO: Alternative approach. Fetch each team by ID.
-        # TODO: No way to fetch multiple teams by ID in a single request - API improvement area
-        results = paginate(client=get_client(), entity="teams", params={}, maximum_records=1000)
-        teams = [Team(**team) for team in results if team["id"] in user_team_ids]
+        client = get_client()
+        if not user_team_ids:
+            teams = []
+        elif (embedded_teams := _fetch_embedded_user_teams(client)) is not None:
+            teams = embedded_teams
+        elif len(user_team_ids) <= MAX_TEAM_LOOKUPS:
+            # Most users belong to a handful of teams, so fetching each one directly is cheaper
+            # than scanning every team in the account.
+            # TODO: No way to fetch multiple teams by ID in a single request - API improvement area
+            responses = run_concurrently(lambda team_id: client.rget(f"/teams/{team_id}"), user_team_ids)
+            teams = _TEAM_LIST_ADAPTER.validate_python(responses)
+        else:
+            # Paginate limits to 1000 results by default
+            teams = []
+            for page in iter_pages(client=client, entity="teams", params={}, maximum_records=1000):
+                teams.extend(_TEAM_LIST_ADAPTER.validate_python([team for team in page if team["id"] in user_team_ids]))
     else:
         params: dict[str, Any] = {}
         if query:
             params["query"] = query
         if limit is not None:
             params["limit"] = limit
-        response = paginate(client=get_client(), entity="teams", params=params, maximum_records=limit or 1000)
-        teams = [Team(**team) for team in response]
+        pages = iter_pages(client=get_client(), entity="teams", params=params, maximum_records=limit or 1000)
+        teams = [team for page in pages for team in _TEAM_LIST_ADAPTER.validate_python(page)]
     return ListResponseModel[Team](response=teams)
 
 
+def _fetch_embedded_user_teams(client) -> list[Team] | None:
+    """Fetch the current user's teams as embedded in /users/me, in a single request.
+
+    Returns None if the response only carries team references, which lack the team name.
+    """
+    user = client.rget("/users/me", params={"include[]": ["teams"]})
+    embedded_teams = user.get("teams") if isinstance(user, dict) else None
+    if not embedded_teams or any("name" not in team for team in embedded_teams):
+        return None
+    return _TEAM_LIST_ADAPTER.validate_python(embedded_teams)
+
+
 def get_team(team_id: str) -> Team:
     """Get a specific team.
 
@@ -72,11 +111,7 @@ def create_team(create_model: TeamCreateRequest) -> Team:
         The created team.
     """
     response = get_client().rpost("/teams", json=create_model.model_dump())
-
-    if type(response) is dict and "team" in response:
-        return Team(**response["team"])
-
-    return Team.model_validate(response)
+    return _TEAM_RESPONSE_ADAPTER.validate_python(response)
 
 
 def update_team(team_id: str, update_model: TeamCreateRequest) -> Team:
@@ -89,11 +124,7 @@ def update_team(team_id: str, update_model: TeamCreateRequest) -> Team:
         The updated team
     """
     response = get_client().rput(f"/teams/{team_id}", json=update_model.model_dump())
-
-    if type(response) is dict and "team" in response:
-        return Team.model_validate(response["team"])
-
-    return Team.model_validate(response)
+    return _TEAM_RESPONSE_ADAPTER.validate_python(response)
 
 
 def delete_team(team_id: str) -> str:
@@ -120,7 +151,7 @@ def list_team_members(team_id: str) -> ListResponseModel[UserReference]:
     """
     response = paginate(client=get_client(), entity=f"/teams/{team_id}/members", params={}, maximum_records=1000)
     # The response is already a list, so we process it and wrap it
-    users = [UserReference(**user.get("user")) for user in response]
+    users = _USER_REFERENCE_LIST_ADAPTER.validate_python([member.get("user") for member in response])
     return ListResponseModel[UserReference](response=users)
 
 
@@ -152,3 +183,58 @@ def remove_team_member(team_id: str, user_id: str) -> str:
     """
     get_client().rdelete(f"/teams/{team_id}/users/{user_id}")
     return f"Successfully removed user {user_id} from team {team_id}"
+
+
+def add_team_members_bulk(team_id: str, members: list[TeamMemberAdd]) -> TeamMembersBulkResult:
+    """Add several users to a team at once.
+
+    Args:
+        team_id: The ID of the team to add the users to
+        members: The users to add, each with the role they should have on the team (at most 50)
+
+    Returns:
+        The users that were added and the users that could not be added, with the reason
+    """
+    client = get_client()
+    members_by_user_id = {member.user_id: member for member in members}
+    return _change_team_members(
+        list(members_by_user_id),
+        lambda user_id: client.put(f"/teams/{team_id}/users/{user_id}", json=members_by_user_id[user_id].model_dump()),
+    )
+
+
+def remove_team_members_bulk(team_id: str, user_ids: list[str]) -> TeamMembersBulkResult:
+    """Remove several users from a team at once.
+
+    Args:
+        team_id: The ID of the team to remove the users from
+        user_ids: The IDs of the users to remove (at most 50)
+
+    Returns:
+        The users that were removed and the users that could not be removed, with the reason
+    """
+    client = get_client()
+    return _change_team_members(
+        list(dict.fromkeys(user_ids)), lambda user_id: client.delete(f"/teams/{team_id}/users/{user_id}")
+    )
+
+
+def _change_team_members(user_ids: list[str], request: Callable[[str], Response]) -> TeamMembersBulkResult:
+    """Send one membership request per user concurrently, collecting failures instead of raising."""
+    if len(user_ids) > MAX_TEAM_MEMBER_CHANGES:
+        raise ValueError(f"At most {MAX_TEAM_MEMBER_CHANGES} users can be changed at once, got {len(user_ids)}.")
+
+    def failure_reason(user_id: str) -> str | None:
+        try:
+            response = request(user_id)
+        except Exception as exc:  # noqa: BLE001 - one failed user must not hide the outcome for the others
+            return str(exc)
+        return None if response.ok else f"{response.status_code} {response.reason}"
+
+    result = TeamMembersBulkResult()
+    for user_id, reason in zip(user_ids, run_concurrently(failure_reason, user_ids), strict=True):
+        if reason is None:
+            result.successful.append(user_id)
+        else:
+            result.failed.append(TeamMemberFailure(user_id=user_id, reason=reason))
+    return result
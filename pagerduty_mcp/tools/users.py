@@ -1,9 +1,13 @@
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import ListResponseModel, User
 from pagerduty_mcp.models.users import CreateUserRequest
 
+_USER_LIST_ADAPTER = TypeAdapter(list[User])
+
 
 def get_user_data() -> User:
     """Get the current user's data.
@@ -39,7 +43,7 @@ def list_users(
         params["limit"] = limit
 
     response = get_client().rget("/users", params=params)
-    users = [User(**user) for user in response]
+    users = _USER_LIST_ADAPTER.validate_python(response)
     return ListResponseModel[User](response=users)
 
 
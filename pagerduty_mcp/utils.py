@@ -1,12 +1,29 @@
-from pagerduty import RestApiV2Client
-from pagerduty_mcp.models import MAX_RESULTS
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from itertools import batched, islice
+from typing import Annotated, Any
+
+from pagerduty import ITERATION_LIMIT, RestApiV2Client, UrlError, successful_response, try_decoding
+from pydantic import BaseModel, BeforeValidator, TypeAdapter
+
+from pagerduty_mcp.models import MAX_RESULTS, BulkLookupFailure, BulkLookupResponse
+from pagerduty_mcp.models.base import MAX_BULK_LOOKUP_IDS, MAXIMUM_PAGINATION_LIMIT
+
+# Upper bound on simultaneous requests issued by a single tool call, to stay well within
+# the PagerDuty REST API rate limits.
+MAX_CONCURRENT_REQUESTS = 5
 
 
 def paginate(*, client: RestApiV2Client, entity: str, params: dict, maximum_records: int = MAX_RESULTS):
     """Paginate results.
 
     Paginate through the results of a request to the PagerDuty API, while allowing for early termination
-    if the maximum number of records is reached.
+    if the maximum number of records is reached. The page size is capped at the maximum number of records
+    so small requests are served by a single page without over-fetching. When more than one page is
+    needed from an endpoint with classic (offset-based) pagination, the first page reports the total and
+    the remaining pages are fetched concurrently.
 
     Args:
         client: The PagerDuty API client
@@ -16,11 +33,170 @@ def paginate(*, client: RestApiV2Client, entity: str, params: dict, maximum_reco
     Returns:
         A list of results
     """
-    results = []
-    count = 0
-    for incident in client.iter_all(entity, params=params):
-        results.append(incident)
-        count += 1  # noqa: SIM113
-        if count >= maximum_records:
-            break
-    return results
+    if maximum_records <= 0:
+        return []
+    page_size = min(maximum_records, MAXIMUM_PAGINATION_LIMIT)
+    wrapper = _offset_pagination_wrapper(client, entity) if maximum_records > page_size else None
+    if wrapper is None:
+        return list(islice(client.iter_all(entity, params=params, page_size=page_size), maximum_records))
+
+    pages = _iter_offset_pages(client, entity, params, wrapper, page_size, maximum_records)
+    return [record for page in pages for record in page]
+
+
+def iter_pages(
+    *, client: RestApiV2Client, entity: str, params: dict, maximum_records: int = MAX_RESULTS
+) -> Iterator[list[dict]]:
+    """Paginate results one page at a time.
+
+    Like `paginate`, but yields each page as it is fetched so callers can validate a page and
+    release its raw records before the next one is requested, instead of holding every raw
+    record alongside the validated models. Pages of classic-pagination endpoints are fetched
+    concurrently in batches of at most MAX_CONCURRENT_REQUESTS, so only one batch of raw pages
+    is held at a time.
+
+    Args:
+        client: The PagerDuty API client
+        entity: The entity to paginate through (e.g., "incidents")
+        params: The parameters to pass to the API request
+        maximum_records: The maximum number of records to return
+    Yields:
+        Lists of results, at most one page long
+    """
+    if maximum_records <= 0:
+        return
+    page_size = min(maximum_records, MAXIMUM_PAGINATION_LIMIT)
+    wrapper = _offset_pagination_wrapper(client, entity) if maximum_records > page_size else None
+    if wrapper is None:
+        records = islice(client.iter_all(entity, params=params, page_size=page_size), maximum_records)
+        for page in batched(records, page_size):
+            yield list(page)
+        return
+
+    yield from _iter_offset_pages(client, entity, params, wrapper, page_size, maximum_records)
+
+
+def _iter_offset_pages(
+    client: RestApiV2Client, entity: str, params: dict, wrapper: str, page_size: int, maximum_records: int
+) -> Iterator[list[dict]]:
+    """Yield the pages of a classic-pagination endpoint, fetching those after the first concurrently."""
+
+    def fetch_page(offset: int, *, total: bool = False) -> dict:
+        page_params = {"limit": page_size, **params, "offset": offset}
+        if total:
+            page_params["total"] = "true"
+        return try_decoding(successful_response(client.get(entity, params=page_params)))
+
+    first_offset = int(params.get("offset", 0))
+    first_page = fetch_page(first_offset, total=True)
+    records = first_page.get(wrapper, [])[:maximum_records]
+    step = len(records)
+    if records:
+        yield records
+    remaining = maximum_records - step
+    if not first_page.get("more") or step == 0 or remaining <= 0:
+        return
+
+    if not isinstance(first_page.get("total"), int):
+        # Without a total the number of pages is unknown, so continue sequentially.
+        rest = client.iter_all(entity, params={**params, "offset": first_offset + step}, page_size=page_size)
+        for page in batched(islice(rest, remaining), page_size):
+            yield list(page)
+        return
+
+    end = min(first_offset + maximum_records, first_page["total"])
+    offsets = [offset for offset in range(first_offset + step, end, step) if offset + step <= ITERATION_LIMIT]
+    for batch in batched(offsets, MAX_CONCURRENT_REQUESTS):
+        for page in run_concurrently(fetch_page, batch):
+            records = page.get(wrapper, [])[:remaining]
+            remaining -= len(records)
+            if records:
+                yield records
+
+
+def _offset_pagination_wrapper(client: RestApiV2Client, entity: str) -> str | None:
+    """Return the entity wrapper of an endpoint that uses classic pagination, or None if it does not."""
+    try:
+        path = client.canonical_path(entity)
+        if path in client.cursor_based_pagination_paths:
+            return None
+        return client.entity_wrappers("GET", path)[1]
+    except UrlError:
+        return None
+
+
+def run_concurrently[T, R](
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = MAX_CONCURRENT_REQUESTS
+) -> list[R]:
+    """Run a blocking function over several items concurrently.
+
+    Each call runs on a bounded thread pool in a copy of the caller's context, so functions that
+    resolve the client through the ContextResolver see the same request context.
+
+    Args:
+        func: The function to call for each item
+        items: The items to pass to the function
+        max_workers: The maximum number of calls in flight at once
+    Returns:
+        The results, in the same order as the items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(copy_context().run, func, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def lookup_by_ids[M: BaseModel](model: type[M], lookup: Callable[[str], M], ids: list[str]) -> BulkLookupResponse[M]:
+    """Look up several entities by ID concurrently, collecting failures instead of raising.
+
+    Args:
+        model: The entity model returned by the lookup
+        lookup: The function that retrieves one entity by ID
+        ids: The IDs to look up; duplicates are looked up once
+    Returns:
+        The entities that were retrieved, in the order their IDs were given, and the IDs that
+        could not be retrieved, with the reason
+    Raises:
+        ValueError: If more than MAX_BULK_LOOKUP_IDS distinct IDs are given
+    """
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_BULK_LOOKUP_IDS:
+        raise ValueError(f"At most {MAX_BULK_LOOKUP_IDS} IDs can be looked up at once, got {len(ids)}.")
+
+    def try_lookup(entity_id: str) -> M | BulkLookupFailure:
+        try:
+            return lookup(entity_id)
+        except Exception as exc:  # noqa: BLE001 - one failed ID must not hide the entities that were found
+            return BulkLookupFailure(id=entity_id, reason=str(exc))
+
+    result = BulkLookupResponse[model](response=[])
+    for outcome in run_concurrently(try_lookup, ids):
+        if isinstance(outcome, BulkLookupFailure):
+            result.failed.append(outcome)
+        else:
+            result.response.append(outcome)
+    return result
+
+
+def enveloped_entity_adapter[M: BaseModel](model: type[M], wrapper: str) -> TypeAdapter[M]:
+    """Build a TypeAdapter that validates an entity whether or not it is wrapped in its API envelope.
+
+    Create and update endpoints may return either the entity itself or `{wrapper: entity}`; the adapter
+    accepts both so callers can validate the response in one step.
+
+    Args:
+        model: The entity model
+        wrapper: The key the API wraps the entity in, such as "team" for teams
+    Returns:
+        A TypeAdapter producing the entity model
+    """
+    return TypeAdapter(Annotated[model, BeforeValidator(partial(_unwrap_entity, wrapper))])
+
+
+def _unwrap_entity(wrapper: str, value: Any) -> Any:
+    if isinstance(value, dict) and wrapper in value:
+        return value[wrapper]
+    return value
@@ -0,0 +1,368 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pagerduty import Error, HttpError
+from pagerduty.rest_api_v2_client import RestApiV2Client
+from requests import Request, Response, Session
+
+from pagerduty_mcp.cache import track_stale_reads
+from pagerduty_mcp.circuit_breaker import CircuitBreaker
+from pagerduty_mcp.context.application_context_strategy import (
+    RATE_LIMIT_RETRIES,
+    STALE_FALLBACK_MAX_AGE,
+    CircuitOpenError,
+    PagerdutyMCPClient,
+)
+
+
+def make_response(status_code=200):
+    """Build a mock Response, for tests that mock RestApiV2Client.request."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = {}
+    return response
+
+
+def make_http_response(status_code=200):
+    """Build a real Response, for tests that mock the HTTP session below the SDK's retry loop."""
+    response = Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    response.request = Request("GET", "https://api.pagerduty.com/services").prepare()
+    response.elapsed = timedelta(0)
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create a client with an empty cache."""
+    return PagerdutyMCPClient("test_api_key")
+
+
+@pytest.fixture
+def mock_request():
+    """Patch the SDK's request method to answer every call with a successful response."""
+    with patch.object(RestApiV2Client, "request") as mock_request:
+        mock_request.side_effect = lambda *args, **kwargs: make_response()
+        yield mock_request
+
+
+class TestPagerdutyMCPClientResponseCache:
+    """Test cases for the response cache on PagerdutyMCPClient."""
+
+    def test_repeated_cacheable_get_is_served_from_cache(self, client, mock_request):
+        first = client.request("GET", "/teams", params={"query": "ops"})
+        second = client.request("GET", "/teams", params={"query": "ops"})
+
+        assert first is second
+        assert mock_request.call_count == 1
+
+    def test_different_params_are_cached_separately(self, client, mock_request):
+        client.request("GET", "/teams", params={"offset": 0})
+        client.request("GET", "/teams", params={"offset": 100})
+
+        assert mock_request.call_count == 2
+
+    def test_uncached_path_always_hits_the_api(self, client, mock_request):
+        client.request("GET", "/incidents")
+        client.request("GET", "/incidents")
+
+        assert mock_request.call_count == 2
+
+    def test_by_id_lookups_are_cached(self, client, mock_request):
+        client.request("GET", "/change_events/PCHANGE1")
+        client.request("GET", "/change_events/PCHANGE1")
+
+        assert mock_request.call_count == 1
+
+    def test_incident_lookups_are_cached(self, client, mock_request):
+        client.request("GET", "/incidents/PINC1")
+        client.request("GET", "/incidents/PINC1")
+        client.request("GET", "/incidents/PINC1/notes")
+
+        assert mock_request.call_count == 2
+
+    def test_v3_schedule_list_is_cached(self, client, mock_request):
+        client.request("GET", "https://api.pagerduty.com/v3/schedules", params={"limit": 25})
+        client.request("GET", "https://api.pagerduty.com/v3/schedules", params={"limit": 25})
+        client.request("GET", "https://api.pagerduty.com/v3/schedules/PSCHED1")
+
+        assert mock_request.call_count == 2
+
+    def test_status_page_configuration_is_cached(self, client, mock_request):
+        client.request("GET", "/status_pages/PSP1/severities")
+        client.request("GET", "/status_pages/PSP1/severities")
+        client.request("GET", "/status_pages/PSP1/posts/PPOST1/post_updates")
+        client.request("GET", "/status_pages/PSP1/posts/PPOST1/post_updates")
+
+        assert mock_request.call_count == 3
+
+    def test_event_orchestration_router_is_not_cached(self, client, mock_request):
+        client.request("GET", "/event_orchestrations/PEO1/router")
+        client.request("GET", "/event_orchestrations/PEO1/router")
+
+        assert mock_request.call_count == 2
+
+    def test_error_responses_are_not_cached(self, client, mock_request):
+        mock_request.side_effect = lambda *args, **kwargs: make_response(500)
+
+        client.request("GET", "/users/me")
+        client.request("GET", "/users/me")
+
+        assert mock_request.call_count == 2
+
+    def test_concurrent_identical_reads_share_one_request(self, client, mock_request):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return make_response()
+
+        mock_request.side_effect = slow_request
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(client.request, "GET", "/escalation_policies")]
+            started.wait(timeout=5)
+            futures += [executor.submit(client.request, "GET", "/escalation_policies") for _ in range(2)]
+            time.sleep(0.1)
+            release.set()
+            responses = [future.result(timeout=5) for future in futures]
+
+        assert mock_request.call_count == 1
+        assert all(response is responses[0] for response in responses)
+
+    def test_write_clears_the_cache(self, client, mock_request):
+        client.request("GET", "/teams/PTEAM1")
+        client.request("PUT", "/teams/PTEAM1/users/PUSER1", json={})
+        client.request("GET", "/teams/PTEAM1")
+
+        assert mock_request.call_count == 3
+
+
+class TestPagerdutyMCPClientStaleFallback:
+    """Test cases for serving the last good response while the API is unavailable."""
+
+    def test_rate_limited_read_falls_back_to_last_good_response(self, client, mock_request):
+        client.request("GET", "/services")
+        client.response_cache.clear()
+        mock_request.side_effect = lambda *args, **kwargs: make_response(429)
+
+        with track_stale_reads() as stale_reads:
+            response = client.request("GET", "/services")
+
+        assert response.ok
+        assert response.headers["X-Stale"] == "true"
+        assert stale_reads == ["https://api.pagerduty.com/services"]
+
+    def test_network_error_falls_back_to_last_good_response(self, client, mock_request):
+        client.request("GET", "/oncalls")
+        client.response_cache.clear()
+        mock_request.side_effect = Error("Non-transient network error")
+
+        response = client.request("GET", "/oncalls")
+
+        assert response.headers["X-Stale"] == "true"
+
+    def test_network_error_without_last_good_response_is_raised(self, client, mock_request):
+        mock_request.side_effect = Error("Non-transient network error")
+
+        with pytest.raises(Error):
+            client.request("GET", "/oncalls")
+
+    def test_single_entity_reads_do_not_fall_back(self, client, mock_request):
+        client.request("GET", "/teams/PTEAM1")
+        client.response_cache.clear()
+        mock_request.side_effect = lambda *args, **kwargs: make_response(503)
+
+        response = client.request("GET", "/teams/PTEAM1")
+
+        assert response.status_code == 503
+
+    def test_incident_lookups_do_not_fall_back(self, client, mock_request):
+        client.request("GET", "/incidents/PINC1")
+        client.response_cache.clear()
+        mock_request.side_effect = lambda *args, **kwargs: make_response(503)
+
+        with track_stale_reads() as stale_reads:
+            response = client.request("GET", "/incidents/PINC1")
+
+        assert response.status_code == 503
+        assert stale_reads == []
+
+    def test_write_drops_the_last_good_responses(self, client, mock_request):
+        client.request("GET", "/services")
+        client.request("PUT", "/services/PSVC1", json={})
+        mock_request.side_effect = lambda *args, **kwargs: make_response(503)
+
+        response = client.request("GET", "/services")
+
+        assert response.status_code == 503
+
+    def test_last_good_response_expires(self, client, mock_request):
+        client.request("GET", "/services")
+        client.response_cache.clear()
+        mock_request.side_effect = lambda *args, **kwargs: make_response(503)
+        later = time.monotonic() + STALE_FALLBACK_MAX_AGE + 1
+
+        with patch("pagerduty_mcp.cache.time.monotonic", return_value=later):
+            response = client.request("GET", "/services")
+
+        assert response.status_code == 503
+
+    def test_unauthorized_read_does_not_fall_back(self, client, mock_request):
+        client.request("GET", "/teams")
+        client.response_cache.clear()
+        mock_request.side_effect = HttpError("401 Unauthorized", make_response(401))
+
+        with pytest.raises(HttpError):
+            client.request("GET", "/teams")
+
+    def test_client_errors_do_not_fall_back(self, client, mock_request):
+        client.request("GET", "/teams/PTEAM1")
+        client.response_cache.clear()
+        mock_request.side_effect = lambda *args, **kwargs: make_response(404)
+
+        response = client.request("GET", "/teams/PTEAM1")
+
+        assert response.status_code == 404
+
+
+class TestPagerdutyMCPClientRateLimiting:
+    """Test cases for rate-limited requests, mocked below the SDK's retry loop."""
+
+    @pytest.fixture
+    def session_request(self):
+        with patch.object(Session, "request") as session_request, patch("pagerduty.api_client.time.sleep"):
+            yield session_request
+
+    def test_rate_limited_read_falls_back_to_last_good_response(self, client, session_request):
+        rate_limited = [make_http_response(429) for _ in range(RATE_LIMIT_RETRIES + 1)]
+        session_request.side_effect = [make_http_response(), *rate_limited]
+        client.request("GET", "/services")
+        client.response_cache.clear()
+
+        response = client.request("GET", "/services")
+
+        assert response.headers["X-Stale"] == "true"
+        assert session_request.call_count == RATE_LIMIT_RETRIES + 2
+
+    def test_rate_limited_read_without_fallback_keeps_retrying(self, client, session_request):
+        rate_limited = [make_http_response(429) for _ in range(RATE_LIMIT_RETRIES + 2)]
+        session_request.side_effect = [make_http_response(), *rate_limited, make_http_response()]
+        client.request("GET", "/incidents/PINC1")
+        client.response_cache.clear()
+
+        response = client.request("GET", "/incidents/PINC1")
+
+        assert response.status_code == 200
+        assert session_request.call_count == RATE_LIMIT_RETRIES + 4
+
+    def test_rate_limited_write_keeps_retrying(self, client, session_request):
+        rate_limited = [make_http_response(429) for _ in range(RATE_LIMIT_RETRIES + 2)]
+        session_request.side_effect = [*rate_limited, make_http_response()]
+
+        response = client.request("POST", "/incidents", json={})
+
+        assert response.status_code == 200
+        assert session_request.call_count == RATE_LIMIT_RETRIES + 3
+
+
+class TestPagerdutyMCPClientConditionalGet:
+    """Test cases for revalidating expired cache entries with conditional requests."""
+
+    def test_expired_read_sends_validators_and_reuses_unchanged_response(self, client, mock_request):
+        first = make_response()
+        first.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}
+        mock_request.side_effect = [first, make_response(304)]
+
+        client.request("GET", "/priorities")
+        client.response_cache.clear()
+        response = client.request("GET", "/priorities")
+
+        assert response is first
+        assert mock_request.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT",
+        }
+        # The revalidated response is fresh again.
+        client.request("GET", "/priorities")
+        assert mock_request.call_count == 2
+
+    def test_changed_response_replaces_the_cached_one(self, client, mock_request):
+        first = make_response()
+        first.headers = {"ETag": '"v1"'}
+        second = make_response()
+        mock_request.side_effect = [first, second]
+
+        client.request("GET", "/priorities")
+        client.response_cache.clear()
+
+        assert client.request("GET", "/priorities") is second
+
+    @pytest.mark.parametrize("path", ["/incidents", "/log_entries"])
+    def test_uncached_list_reads_are_revalidated(self, client, mock_request, path):
+        first = make_response()
+        first.headers = {"ETag": '"v1"'}
+        mock_request.side_effect = [first, make_response(304)]
+
+        client.request("GET", path, params={"limit": 25})
+        response = client.request("GET", path, params={"limit": 25})
+
+        assert response is first
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_read_without_validators_is_unconditional(self, client, mock_request):
+        client.request("GET", "/priorities")
+        client.response_cache.clear()
+        client.request("GET", "/priorities")
+
+        assert "headers" not in mock_request.call_args.kwargs
+
+
+class TestPagerdutyMCPClientCircuitBreaker:
+    """Test cases for failing fast while the API keeps failing."""
+
+    @pytest.fixture
+    def client(self):
+        client = PagerdutyMCPClient("test_api_key")
+        client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        return client
+
+    def test_repeated_server_errors_open_the_circuit(self, client, mock_request):
+        mock_request.side_effect = lambda *args, **kwargs: make_response(503)
+        client.request("GET", "/incidents")
+        client.request("GET", "/incidents")
+
+        with pytest.raises(CircuitOpenError):
+            client.request("POST", "/incidents", json={})
+
+        assert mock_request.call_count == 2
+
+    def test_open_circuit_falls_back_to_last_good_response(self, client, mock_request):
+        client.request("GET", "/services")
+        client.response_cache.clear()
+        mock_request.side_effect = Error("Non-transient network error")
+        with pytest.raises(Error):
+            client.request("GET", "/incidents")
+        with pytest.raises(Error):
+            client.request("GET", "/incidents")
+
+        response = client.request("GET", "/services")
+
+        assert response.headers["X-Stale"] == "true"
+        assert mock_request.call_count == 3
+
+    def test_client_errors_do_not_open_the_circuit(self, client, mock_request):
+        mock_request.side_effect = lambda *args, **kwargs: make_response(404)
+        for _ in range(3):
+            client.request("GET", "/incidents/PINC1")
+
+        assert mock_request.call_count == 3
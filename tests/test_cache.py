@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from pagerduty_mcp.cache import SingleFlight, TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for the TTLCache."""
+
+    def setUp(self):
+        self.cache = TTLCache(maxsize=2)
+
+    def test_get_missing_key(self):
+        """Test that a missing key returns None."""
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_get_fresh_entry(self):
+        """Test that an entry is returned while it is fresh."""
+        self.cache.set("key", "value", ttl=60)
+
+        self.assertEqual(self.cache.get("key"), "value")
+
+    @patch("pagerduty_mcp.cache.time.monotonic")
+    def test_get_expired_entry(self, mock_monotonic):
+        """Test that an entry is dropped once its time-to-live has passed."""
+        mock_monotonic.return_value = 100.0
+        self.cache.set("key", "value", ttl=15)
+
+        mock_monotonic.return_value = 115.0
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_evicts_oldest_entry_when_full(self):
+        """Test that the oldest entry is evicted once the cache is full."""
+        self.cache.set("first", 1, ttl=60)
+        self.cache.set("second", 2, ttl=60)
+        self.cache.set("third", 3, ttl=60)
+
+        self.assertIsNone(self.cache.get("first"))
+        self.assertEqual(self.cache.get("second"), 2)
+        self.assertEqual(self.cache.get("third"), 3)
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        self.cache.set("key", "value", ttl=60)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("key"))
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for SingleFlight."""
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def slow_call(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return "result"
+
+    def test_concurrent_calls_with_same_key_share_one_call(self):
+        """Test that callers arriving while a call is in flight wait for its result."""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self.single_flight.do, "key", self.slow_call)]
+            self.started.wait(timeout=5)
+            futures += [executor.submit(self.single_flight.do, "key", self.slow_call) for _ in range(2)]
+            time.sleep(0.1)
+            self.release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(results, ["result"] * 3)
+        self.assertEqual(self.calls, 1)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call is not reused by later callers."""
+        self.release.set()
+
+        self.single_flight.do("key", self.slow_call)
+        self.single_flight.do("key", self.slow_call)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_exception_is_raised_and_call_is_forgotten(self):
+        """Test that a failing call raises and does not block later calls."""
+
+        def failing_call():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            self.single_flight.do("key", failing_call)
+
+        self.assertEqual(self.single_flight.do("key", lambda: "retried"), "retried")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
-from pagerduty_mcp.models.base import DEFAULT_PAGINATION_LIMIT, MAXIMUM_PAGINATION_LIMIT
+from pagerduty_mcp.models.base import DEFAULT_PAGINATION_LIMIT, MAX_BULK_LOOKUP_IDS, MAXIMUM_PAGINATION_LIMIT
 from pagerduty_mcp.models.change_events import (
     ChangeEvent,
     ChangeEventQuery,
@@ -10,6 +10,7 @@ from pagerduty_mcp.models.change_events import (
 from pagerduty_mcp.models.references import IntegrationReference, ServiceReference
 from pagerduty_mcp.tools.change_events import (
     get_change_event,
+    get_change_events_bulk,
     list_change_events,
     list_incident_change_events,
     list_service_change_events,
@@ -272,6 +273,49 @@ class TestChangeEventTools(unittest.TestCase):
         # Verify result
         self.assertEqual(len(result.response), 0)
 
+    @patch("pagerduty_mcp.tools.change_events.get_client")
+    def test_get_change_events_bulk(self, mock_get_client):
+        """Test retrieving several change events at once keeps the requested order."""
+        mock_get_client.return_value = self.mock_client
+        events_by_id = {
+            "PCE1": {**self.sample_change_event_response, "id": "PCE1"},
+            "PCE2": {"change_event": {**self.sample_change_event_response, "id": "PCE2"}},
+        }
+        self.mock_client.rget.side_effect = lambda path: events_by_id[path.rsplit("/", 1)[-1]]
+
+        result = get_change_events_bulk(["PCE2", "PCE1", "PCE2"])
+
+        self.assertEqual(self.mock_client.rget.call_count, 2)
+        self.assertEqual([event.id for event in result.response], ["PCE2", "PCE1"])
+        self.assertIsInstance(result.response[0], ChangeEvent)
+
+    @patch("pagerduty_mcp.tools.change_events.get_client")
+    def test_get_change_events_bulk_reports_failed_ids(self, mock_get_client):
+        """Test that a change event that cannot be retrieved does not fail the others."""
+        mock_get_client.return_value = self.mock_client
+
+        def rget(path):
+            if path.endswith("/PMISSING"):
+                raise Exception("404 Not Found")
+            return {**self.sample_change_event_response, "id": path.rsplit("/", 1)[-1]}
+
+        self.mock_client.rget.side_effect = rget
+
+        result = get_change_events_bulk(["PCE1", "PMISSING"])
+
+        self.assertEqual([event.id for event in result.response], ["PCE1"])
+        self.assertEqual([(failure.id, failure.reason) for failure in result.failed], [("PMISSING", "404 Not Found")])
+
+    @patch("pagerduty_mcp.tools.change_events.get_client")
+    def test_get_change_events_bulk_caps_the_number_of_ids(self, mock_get_client):
+        """Test that too many change event IDs are rejected before any request is made."""
+        mock_get_client.return_value = self.mock_client
+
+        with self.assertRaises(ValueError):
+            get_change_events_bulk([f"PCE{i}" for i in range(MAX_BULK_LOOKUP_IDS + 1)])
+
+        self.mock_client.rget.assert_not_called()
+
     @patch("pagerduty_mcp.tools.change_events.get_client")
     def test_get_change_event_success_wrapped_response(self, mock_get_client):
         """Test successful retrieval of a specific change event with wrapped response."""
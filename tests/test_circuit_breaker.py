@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+
+from pagerduty_mcp.circuit_breaker import CircuitBreaker
+
+
+@patch("pagerduty_mcp.circuit_breaker.time.monotonic")
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the CircuitBreaker."""
+
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    def open_circuit(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+
+    def test_closed_circuit_allows_calls(self, mock_monotonic):
+        """Test that calls are allowed while failures stay under the threshold."""
+        mock_monotonic.return_value = 100.0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_after(), 0.0)
+
+    def test_success_resets_the_failure_count(self, mock_monotonic):
+        """Test that only consecutive failures count towards opening the circuit."""
+        mock_monotonic.return_value = 100.0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertTrue(self.breaker.allow())
+
+    def test_threshold_opens_the_circuit(self, mock_monotonic):
+        """Test that reaching the failure threshold refuses calls until the reset timeout."""
+        mock_monotonic.return_value = 100.0
+        self.open_circuit()
+
+        mock_monotonic.return_value = 110.0
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_after(), 20.0)
+
+    def test_single_trial_call_after_reset_timeout(self, mock_monotonic):
+        """Test that one trial call is let through once the reset timeout has passed."""
+        mock_monotonic.return_value = 100.0
+        self.open_circuit()
+
+        mock_monotonic.return_value = 130.0
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+    def test_successful_trial_closes_the_circuit(self, mock_monotonic):
+        """Test that a successful trial call closes the circuit."""
+        mock_monotonic.return_value = 100.0
+        self.open_circuit()
+        mock_monotonic.return_value = 130.0
+        self.breaker.allow()
+
+        self.breaker.record_success()
+
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_trial_reopens_the_circuit(self, mock_monotonic):
+        """Test that a failed trial call re-opens the circuit for another reset timeout."""
+        mock_monotonic.return_value = 100.0
+        self.open_circuit()
+        mock_monotonic.return_value = 130.0
+        self.breaker.allow()
+
+        self.breaker.record_failure()
+
+        mock_monotonic.return_value = 150.0
+        self.assertFalse(self.breaker.allow())
+        mock_monotonic.return_value = 160.0
+        self.assertTrue(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
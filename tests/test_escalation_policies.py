@@ -98,30 +98,30 @@ class TestEscalationPolicyTools(unittest.TestCase):
         # Clear any side effects
         self.mock_client.rget.side_effect = None
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_no_query_model(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_no_query_model(self, mock_get_client, mock_iter_pages):
         """Test that list_escalation_policies can be called with no arguments."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_escalation_policies_list_response
+        mock_iter_pages.return_value = [self.sample_escalation_policies_list_response]
 
         result = list_escalation_policies()
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={}
         )
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_no_filters(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_no_filters(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies without any filters."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_escalation_policies_list_response
+        mock_iter_pages.return_value = [self.sample_escalation_policies_list_response]
 
         result = list_escalation_policies()
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={}
         )
 
@@ -133,73 +133,73 @@ class TestEscalationPolicyTools(unittest.TestCase):
         self.assertEqual(result.response[0].name, "Engineering Team Escalation")
         self.assertEqual(result.response[1].name, "DevOps Team Escalation")
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_with_query_filter(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_with_query_filter(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies with query filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_escalation_policies_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_escalation_policies_list_response[0]]]
 
         result = list_escalation_policies(query="Engineering")
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={"query": "Engineering"}
         )
 
         self.assertEqual(len(result.response), 1)
         self.assertEqual(result.response[0].name, "Engineering Team Escalation")
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_with_user_filter(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_with_user_filter(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies with user filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_escalation_policies_list_response
+        mock_iter_pages.return_value = [self.sample_escalation_policies_list_response]
 
         result = list_escalation_policies(user_ids=["USER123", "USER456"])
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={"user_ids[]": ["USER123", "USER456"]}
         )
 
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_with_team_filter(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_with_team_filter(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies with team filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_escalation_policies_list_response
+        mock_iter_pages.return_value = [self.sample_escalation_policies_list_response]
 
         result = list_escalation_policies(team_ids=["TEAM123"])
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={"team_ids[]": ["TEAM123"]}
         )
 
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_with_include_filter(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_with_include_filter(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies with include filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_escalation_policies_list_response
+        mock_iter_pages.return_value = [self.sample_escalation_policies_list_response]
 
         result = list_escalation_policies(include=["services", "teams"])
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={"include[]": ["services", "teams"]}
         )
 
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_with_all_filters(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_with_all_filters(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies with all filters applied."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_escalation_policies_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_escalation_policies_list_response[0]]]
 
         result = list_escalation_policies(
             query="Engineering",
@@ -209,7 +209,7 @@ class TestEscalationPolicyTools(unittest.TestCase):
             limit=50,
         )
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client,
             entity="escalation_policies",
             params={
@@ -223,42 +223,42 @@ class TestEscalationPolicyTools(unittest.TestCase):
 
         self.assertEqual(len(result.response), 1)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_with_custom_limit(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_with_custom_limit(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies with custom limit."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_escalation_policies_list_response
+        mock_iter_pages.return_value = [self.sample_escalation_policies_list_response]
 
         result = list_escalation_policies(limit=50)
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={"limit": 50}
         )
 
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_empty_response(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_empty_response(self, mock_get_client, mock_iter_pages):
         """Test listing escalation policies when paginate returns empty list."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = []
+        mock_iter_pages.return_value = [[]]
 
         result = list_escalation_policies(query="NonExistentPolicy")
 
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="escalation_policies", params={"query": "NonExistentPolicy"}
         )
 
         self.assertEqual(len(result.response), 0)
 
-    @patch("pagerduty_mcp.tools.escalation_policies.paginate")
+    @patch("pagerduty_mcp.tools.escalation_policies.iter_pages")
     @patch("pagerduty_mcp.tools.escalation_policies.get_client")
-    def test_list_escalation_policies_paginate_error(self, mock_get_client, mock_paginate):
+    def test_list_escalation_policies_paginate_error(self, mock_get_client, mock_iter_pages):
         """Test list_escalation_policies when paginate raises an exception."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.side_effect = Exception("Pagination Error")
+        mock_iter_pages.side_effect = Exception("Pagination Error")
 
         with self.assertRaises(Exception) as context:
             list_escalation_policies()
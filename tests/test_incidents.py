@@ -1,7 +1,7 @@
 """Unit tests for incident tools."""
 
 import unittest
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
 from pagerduty_mcp.context import ContextResolver
@@ -29,18 +29,16 @@ from pagerduty_mcp.models import (
     ServiceReference,
     UserReference,
 )
+from pagerduty_mcp.models.base import MAX_BULK_LOOKUP_IDS
 from pagerduty_mcp.tools.alerts import get_alert_from_incident, list_alerts_from_incident
 from pagerduty_mcp.tools.incidents import (
-    _change_incident_status,
-    _change_incident_urgency,
-    _escalate_incident,
     _generate_manage_request,
-    _reassign_incident,
     _update_manage_request,
     add_note_to_incident,
     add_responders,
     create_incident,
     get_incident,
+    get_incidents_bulk,
     get_outlier_incident,
     get_past_incidents,
     get_related_incidents,
@@ -239,6 +237,16 @@ class TestIncidentTools(unittest.TestCase):
         self.assertIn("team_ids[]", call_args[1]["params"])
         self.assertEqual(call_args[1]["params"]["team_ids[]"], ["PTEAM123"])
 
+    @patch("pagerduty_mcp.tools.incidents.paginate")
+    def test_list_incidents_teams_scope_without_teams(self, mock_paginate):
+        """Test listing incidents with teams scope for a user without teams returns nothing."""
+        self.mock_context.user = Mock(id="PUSER123", teams=[])
+
+        result = list_incidents(request_scope="teams")
+
+        self.assertEqual(result.response, [])
+        mock_paginate.assert_not_called()
+
     def test_list_incidents_user_required_error(self):
         """If the request_scope requires user context but none is available, an error should be raised."""
         self.mock_context.user = None
@@ -329,6 +337,51 @@ class TestIncidentTools(unittest.TestCase):
 
         self.assertIn("API Error", str(context.exception))
 
+    @patch("pagerduty_mcp.tools.incidents.get_client")
+    def test_get_incidents_bulk(self, mock_get_client):
+        """Test getting several incidents at once keeps the requested order."""
+        # Setup mock
+        mock_client = Mock()
+        mock_client.rget.side_effect = lambda path, params: {**self.sample_incident_data, "id": path.rsplit("/", 1)[-1]}
+        mock_get_client.return_value = mock_client
+
+        # Test
+        result = get_incidents_bulk(["PINC2", "PINC1", "PINC2"])
+
+        # Assertions
+        self.assertEqual(mock_client.rget.call_count, 2)
+        self.assertEqual([incident.id for incident in result.response], ["PINC2", "PINC1"])
+
+    @patch("pagerduty_mcp.tools.incidents.get_client")
+    def test_get_incidents_bulk_reports_failed_ids(self, mock_get_client):
+        """Test that an incident that cannot be retrieved does not fail the others."""
+
+        def rget(path, params):
+            if path.endswith("/PMISSING"):
+                raise Exception("404 Not Found")
+            return {**self.sample_incident_data, "id": path.rsplit("/", 1)[-1]}
+
+        mock_client = Mock()
+        mock_client.rget.side_effect = rget
+        mock_get_client.return_value = mock_client
+
+        result = get_incidents_bulk(["PINC1", "PMISSING", "PINC2"])
+
+        self.assertEqual([incident.id for incident in result.response], ["PINC1", "PINC2"])
+        self.assertEqual([(failure.id, failure.reason) for failure in result.failed], [("PMISSING", "404 Not Found")])
+        self.assertIn("PMISSING", result.response_summary)
+
+    @patch("pagerduty_mcp.tools.incidents.get_client")
+    def test_get_incidents_bulk_caps_the_number_of_ids(self, mock_get_client):
+        """Test that too many incident IDs are rejected before any request is made."""
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+
+        with self.assertRaises(ValueError):
+            get_incidents_bulk([f"PINC{i}" for i in range(MAX_BULK_LOOKUP_IDS + 1)])
+
+        mock_client.rget.assert_not_called()
+
     @patch("pagerduty_mcp.tools.incidents.get_client")
     def test_get_incident_with_include_single(self, mock_get_client):
         """Test getting an incident with single include parameter."""
@@ -528,41 +581,46 @@ class TestIncidentTools(unittest.TestCase):
             self.assertEqual(incident["status"], "acknowledged")
 
     @patch("pagerduty_mcp.tools.incidents.get_client")
-    def test_change_incident_status(self, mock_get_client):
-        """Test _change_incident_status helper function."""
+    def test_manage_incidents_status_change(self, mock_get_client):
+        """Test manage_incidents with status change."""
         # Setup mock
         mock_client = Mock()
         mock_client.rput.return_value = [self.sample_incident_data]
         mock_get_client.return_value = mock_client
 
         # Test
-        _change_incident_status(["PINC1"], "acknowledged")
+        manage_request = IncidentManageRequest(incident_ids=["PINC1"], status="acknowledged")
+        result = manage_incidents(manage_request)
 
         # Assertions
+        self.assertIsInstance(result, ListResponseModel)
+        self.assertEqual(len(result.response), 1)
         mock_client.rput.assert_called_once_with(
             "/incidents", json={"incidents": [{"type": "incident_reference", "id": "PINC1", "status": "acknowledged"}]}
         )
 
     @patch("pagerduty_mcp.tools.incidents.get_client")
-    def test_change_incident_urgency(self, mock_get_client):
-        """Test _change_incident_urgency helper function."""
+    def test_manage_incidents_urgency_change(self, mock_get_client):
+        """Test manage_incidents with urgency change."""
         # Setup mock
         mock_client = Mock()
         mock_client.rput.return_value = [self.sample_incident_data]
         mock_get_client.return_value = mock_client
 
         # Test
-        _change_incident_urgency(["PINC1"], "low")
+        manage_request = IncidentManageRequest(incident_ids=["PINC1"], urgency="low")
+        result = manage_incidents(manage_request)
 
         # Assertions
+        self.assertEqual(len(result.response), 1)
         mock_client.rput.assert_called_once_with(
             "/incidents", json={"incidents": [{"type": "incident_reference", "id": "PINC1", "urgency": "low"}]}
         )
 
     @patch("pagerduty_mcp.tools.incidents.get_client")
     @patch("pagerduty_mcp.tools.incidents.datetime")
-    def test_reassign_incident(self, mock_datetime, mock_get_client):
-        """Test _reassign_incident helper function."""
+    def test_manage_incidents_reassignment(self, mock_datetime, mock_get_client):
+        """Test manage_incidents with reassignment."""
         # Setup mocks
         mock_client = Mock()
         mock_client.rput.return_value = [self.sample_incident_data]
@@ -574,104 +632,73 @@ class TestIncidentTools(unittest.TestCase):
 
         # Test
         assignee = UserReference(id="PUSER123")
-        _reassign_incident(["PINC1"], assignee)
+        manage_request = IncidentManageRequest(
+            incident_ids=["PINC1"],
+            assignement=assignee,  # Note: typo in original code "assignement"
+        )
+        result = manage_incidents(manage_request)
 
         # Verify the request structure
-        call_args = mock_client.rput.call_args
-        json_data = call_args[1]["json"]
-        self.assertIn("incidents", json_data)
+        self.assertEqual(len(result.response), 1)
+        json_data = mock_client.rput.call_args[1]["json"]
         incident = json_data["incidents"][0]
         self.assertEqual(incident["id"], "PINC1")
-        self.assertIn("assignments", incident)
         assignment = incident["assignments"][0]
-        self.assertEqual(assignment["assignee"]["id"], "PUSER123")
+        mock_datetime.now.assert_called_once_with(UTC)
+        self.assertEqual(assignment["at"], "2023-01-01T00:00:00")
+        self.assertEqual(assignment["assignee"], {"type": "user_reference", "id": "PUSER123"})
 
     @patch("pagerduty_mcp.tools.incidents.get_client")
-    def test_escalate_incident(self, mock_get_client):
-        """Test _escalate_incident helper function."""
+    def test_manage_incidents_escalation(self, mock_get_client):
+        """Test manage_incidents with escalation."""
         # Setup mock
         mock_client = Mock()
         mock_client.rput.return_value = [self.sample_incident_data]
         mock_get_client.return_value = mock_client
 
         # Test
-        _escalate_incident(["PINC1"], 2)
+        manage_request = IncidentManageRequest(incident_ids=["PINC1"], escalation_level=2)
+        result = manage_incidents(manage_request)
 
         # Assertions
+        self.assertEqual(len(result.response), 1)
         mock_client.rput.assert_called_once_with(
             "/incidents", json={"incidents": [{"type": "incident_reference", "id": "PINC1", "escalation_level": 2}]}
         )
 
-    @patch("pagerduty_mcp.tools.incidents._change_incident_status")
-    def test_manage_incidents_status_change(self, mock_change_status):
-        """Test manage_incidents with status change."""
-        # Setup mock
-        mock_change_status.return_value = [self.sample_incident_data]
-
-        # Test
-        manage_request = IncidentManageRequest(incident_ids=["PINC1"], status="acknowledged")
-        result = manage_incidents(manage_request)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 1)
-        mock_change_status.assert_called_once_with(["PINC1"], "acknowledged")
-
-    @patch("pagerduty_mcp.tools.incidents._change_incident_urgency")
-    def test_manage_incidents_urgency_change(self, mock_change_urgency):
-        """Test manage_incidents with urgency change."""
-        # Setup mock
-        mock_change_urgency.return_value = [self.sample_incident_data]
-
-        # Test
-        manage_request = IncidentManageRequest(incident_ids=["PINC1"], urgency="low")
-        result = manage_incidents(manage_request)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 1)
-        mock_change_urgency.assert_called_once_with(["PINC1"], "low")
-
-    @patch("pagerduty_mcp.tools.incidents._reassign_incident")
-    def test_manage_incidents_reassignment(self, mock_reassign):
-        """Test manage_incidents with reassignment."""
+    @patch("pagerduty_mcp.tools.incidents.get_client")
+    def test_manage_incidents_multiple_changes_single_request(self, mock_get_client):
+        """Test manage_incidents sends every change for every incident in one request."""
         # Setup mock
-        mock_reassign.return_value = [self.sample_incident_data]
+        mock_client = Mock()
+        mock_client.rput.return_value = [self.sample_incident_data]
+        mock_get_client.return_value = mock_client
 
         # Test
-        assignee = UserReference(id="PUSER123")
         manage_request = IncidentManageRequest(
-            incident_ids=["PINC1"],
-            assignement=assignee,  # Note: typo in original code "assignement"
+            incident_ids=["PINC1", "PINC2"], status="acknowledged", urgency="high", escalation_level=2
         )
-        result = manage_incidents(manage_request)
+        manage_incidents(manage_request)
 
         # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 1)
-        mock_reassign.assert_called_once_with(["PINC1"], assignee)
-
-    @patch("pagerduty_mcp.tools.incidents._escalate_incident")
-    def test_manage_incidents_escalation(self, mock_escalate):
-        """Test manage_incidents with escalation."""
-        # Setup mock
-        mock_escalate.return_value = [self.sample_incident_data]
-
-        # Test
-        manage_request = IncidentManageRequest(incident_ids=["PINC1"], escalation_level=2)
-        result = manage_incidents(manage_request)
-
-        # Assertions
-        self.assertIsInstance(result, ListResponseModel)
-        self.assertEqual(len(result.response), 1)
-        mock_escalate.assert_called_once_with(["PINC1"], 2)
+        mock_client.rput.assert_called_once()
+        json_data = mock_client.rput.call_args[1]["json"]
+        self.assertEqual([incident["id"] for incident in json_data["incidents"]], ["PINC1", "PINC2"])
+        for incident in json_data["incidents"]:
+            self.assertEqual(incident["status"], "acknowledged")
+            self.assertEqual(incident["urgency"], "high")
+            self.assertEqual(incident["escalation_level"], 2)
 
-    def test_manage_incidents_no_actions(self):
+    @patch("pagerduty_mcp.tools.incidents.get_client")
+    def test_manage_incidents_no_actions(self, mock_get_client):
         """Test manage_incidents with no actions specified."""
         # Test
         manage_request = IncidentManageRequest(incident_ids=["PINC1"])
         result = manage_incidents(manage_request)
 
+        # No request should be made
+        mock_get_client.assert_not_called()
+
         # Should return empty response
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 0)
@@ -135,9 +135,10 @@ class TestLogEntryTools(unittest.TestCase):
         self.assertEqual(result.response[0].id, "PLOGENTRY123")
         mock_paginate.assert_called_once()
 
-        # Verify that default timestamps were set (last 7 days)
+        # Verify that default timestamps were set (exactly the last 7 days)
         self.assertIsNotNone(query_model.since)
         self.assertIsNotNone(query_model.until)
+        self.assertEqual(query_model.until - query_model.since, timedelta(days=7))
 
     @patch("pagerduty_mcp.tools.log_entries.paginate")
     @patch("pagerduty_mcp.tools.log_entries.get_client")
@@ -80,31 +80,35 @@ class TestOncallTools(unittest.TestCase):
         """Reset mock before each test."""
         self.mock_client.reset_mock()
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_no_query_model(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_no_query_model(self, mock_get_client, mock_iter_pages):
         """Test that list_oncalls can be called with no arguments."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         result = list_oncalls()
 
         expected_params = {"earliest": "true"}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_no_filters(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_no_filters(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls without any filters."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         result = list_oncalls()
 
         # Verify paginate call — earliest defaults to True
         expected_params = {"earliest": "true"}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
@@ -115,12 +119,12 @@ class TestOncallTools(unittest.TestCase):
         self.assertEqual(result.response[0].escalation_level, 1)
         self.assertEqual(result.response[1].escalation_level, 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_time_zone(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_time_zone(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with time zone filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         result = list_oncalls(time_zone="America/New_York")
 
@@ -129,17 +133,19 @@ class TestOncallTools(unittest.TestCase):
             "time_zone": "America/New_York",
             "earliest": "true",
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_user_filter(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_user_filter(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with user filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_oncalls_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_oncalls_list_response[0]]]
 
         result = list_oncalls(user_ids=["USER123"])
 
@@ -148,18 +154,20 @@ class TestOncallTools(unittest.TestCase):
             "user_ids[]": ["USER123"],
             "earliest": "true",
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 1)
         self.assertEqual(result.response[0].user.id, "USER123")
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_escalation_policy_filter(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_escalation_policy_filter(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with escalation policy filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_oncalls_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_oncalls_list_response[0]]]
 
         result = list_oncalls(escalation_policy_ids=["EP123"])
 
@@ -168,7 +176,9 @@ class TestOncallTools(unittest.TestCase):
             "escalation_policy_ids[]": ["EP123"],
             "earliest": "true",
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 1)
@@ -176,12 +186,12 @@ class TestOncallTools(unittest.TestCase):
         assert result.response[0].escalation_policy is not None
         self.assertEqual(result.response[0].escalation_policy.id, "EP123")
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_schedule_filter(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_schedule_filter(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with schedule filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_oncalls_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_oncalls_list_response[0]]]
 
         result = list_oncalls(schedule_ids=["SCHED123"])
 
@@ -190,7 +200,9 @@ class TestOncallTools(unittest.TestCase):
             "schedule_ids[]": ["SCHED123"],
             "earliest": "true",
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 1)
@@ -198,12 +210,12 @@ class TestOncallTools(unittest.TestCase):
         assert result.response[0].schedule is not None
         self.assertEqual(result.response[0].schedule.id, "SCHED123")
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_time_range(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_time_range(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with time range filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         since_time = datetime(2023, 12, 1)
         until_time = datetime(2023, 12, 31)
@@ -215,33 +227,37 @@ class TestOncallTools(unittest.TestCase):
             "until": "2023-12-31T00:00:00",
             "earliest": "true",
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_earliest_false(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_earliest_false(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with earliest set to false."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         result = list_oncalls(earliest=False)
 
         # Verify paginate call
         expected_params = {"earliest": "false"}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_all_filters(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_all_filters(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with all filters applied."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_oncalls_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_oncalls_list_response[0]]]
 
         since_time = datetime(2023, 12, 1)
         until_time = datetime(2023, 12, 8)
@@ -267,33 +283,37 @@ class TestOncallTools(unittest.TestCase):
             "earliest": "true",
             "limit": 50,
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=50)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=50
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 1)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_custom_limit(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_custom_limit(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with custom limit."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         result = list_oncalls(limit=100)
 
         # Verify paginate call — earliest defaults to True
         expected_params = {"earliest": "true", "limit": 100}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=100)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=100
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_empty_response(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_empty_response(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls when paginate returns empty list."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = []
+        mock_iter_pages.return_value = [[]]
 
         result = list_oncalls(user_ids=["NONEXISTENT_USER"])
 
@@ -302,26 +322,28 @@ class TestOncallTools(unittest.TestCase):
             "user_ids[]": ["NONEXISTENT_USER"],
             "earliest": "true",
         }
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="oncalls", params=expected_params, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 0)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_paginate_error(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_paginate_error(self, mock_get_client, mock_iter_pages):
         """Test list_oncalls when paginate raises an exception."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.side_effect = Exception("Pagination Error")
+        mock_iter_pages.side_effect = Exception("Pagination Error")
 
         with self.assertRaises(Exception) as context:
             list_oncalls()
 
         self.assertEqual(str(context.exception), "Pagination Error")
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_service_ids(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_service_ids(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls filtered by service IDs (resolves to EP IDs)."""
         mock_client = MagicMock()
         mock_client.rget.return_value = {
@@ -333,7 +355,7 @@ class TestOncallTools(unittest.TestCase):
             },
         }
         mock_get_client.return_value = mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         result = list_oncalls(service_ids=["PSVC123"])
 
@@ -341,15 +363,15 @@ class TestOncallTools(unittest.TestCase):
         mock_client.rget.assert_called_once_with("/services/PSVC123")
 
         # Verify EP ID was passed to paginate
-        call_args = mock_paginate.call_args
+        call_args = mock_iter_pages.call_args
         params = call_args[1]["params"]
         self.assertIn("escalation_policy_ids[]", params)
         self.assertIn("EP_RESOLVED", params["escalation_policy_ids[]"])
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.oncalls.paginate")
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
     @patch("pagerduty_mcp.tools.oncalls.get_client")
-    def test_list_oncalls_with_service_ids_and_ep_ids(self, mock_get_client, mock_paginate):
+    def test_list_oncalls_with_service_ids_and_ep_ids(self, mock_get_client, mock_iter_pages):
         """Test listing oncalls with both service_ids and escalation_policy_ids merges correctly."""
         mock_client = MagicMock()
         mock_client.rget.return_value = {
@@ -361,17 +383,36 @@ class TestOncallTools(unittest.TestCase):
             },
         }
         mock_get_client.return_value = mock_client
-        mock_paginate.return_value = self.sample_oncalls_list_response
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
 
         list_oncalls(escalation_policy_ids=["EP_EXPLICIT"], service_ids=["PSVC123"])
 
-        call_args = mock_paginate.call_args
+        call_args = mock_iter_pages.call_args
         params = call_args[1]["params"]
         ep_ids = params["escalation_policy_ids[]"]
         self.assertIn("EP_EXPLICIT", ep_ids)
         self.assertIn("EP_FROM_SERVICE", ep_ids)
         self.assertEqual(len(ep_ids), 2)
 
+    @patch("pagerduty_mcp.tools.oncalls.iter_pages")
+    @patch("pagerduty_mcp.tools.oncalls.get_client")
+    def test_list_oncalls_with_multiple_service_ids(self, mock_get_client, mock_iter_pages):
+        """Test that several service IDs resolve to their EP IDs in the order given."""
+        mock_client = MagicMock()
+        mock_client.rget.side_effect = lambda path: {
+            "id": path.rsplit("/", 1)[-1],
+            "name": "Service",
+            "escalation_policy": {"id": f"EP_{path.rsplit('/', 1)[-1]}", "summary": "EP"},
+        }
+        mock_get_client.return_value = mock_client
+        mock_iter_pages.return_value = [self.sample_oncalls_list_response]
+
+        list_oncalls(escalation_policy_ids=["EP_EXPLICIT"], service_ids=["PSVC1", "PSVC2", "PSVC3"])
+
+        self.assertEqual(mock_client.rget.call_count, 3)
+        params = mock_iter_pages.call_args[1]["params"]
+        self.assertEqual(params["escalation_policy_ids[]"], ["EP_EXPLICIT", "EP_PSVC1", "EP_PSVC2", "EP_PSVC3"])
+
     @patch("pagerduty_mcp.tools.oncalls.get_client")
     def test_list_oncalls_service_not_found(self, mock_get_client):
         """Test listing oncalls with invalid service ID propagates error."""
@@ -3,9 +3,17 @@ from unittest.mock import MagicMock, patch
 
 from pagerduty.errors import HttpError
 
-from pagerduty_mcp.models import Schedule, ScheduleQuery, ScheduleV3, ScheduleV3Create, ScheduleV3Update
+from pagerduty_mcp.models import (
+    Schedule,
+    ScheduleOverrideCreate,
+    ScheduleQuery,
+    ScheduleV3,
+    ScheduleV3Create,
+    ScheduleV3Update,
+)
 from pagerduty_mcp.tools.schedules import (
     create_schedule,
+    create_schedule_override,
     get_schedule,
     list_schedules,
     update_schedule,
@@ -226,6 +234,37 @@ class TestCreateUpdateRouting(unittest.TestCase):
         self.assertIn("layer-based", str(ctx.exception))
 
 
+class TestCreateScheduleOverride(unittest.TestCase):
+    """Overrides are posted to the layer-based (v2) API with ISO timestamps and user references."""
+
+    @patch(f"{SCHED}.get_client")
+    def test_posts_serialized_overrides(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        request = ScheduleOverrideCreate.model_validate(
+            {
+                "overrides": [
+                    {"start": "2025-01-01T09:00:00-05:00", "end": "2025-01-01T17:00:00-05:00", "user_id": "PU1"}
+                ]
+            }
+        )
+
+        create_schedule_override("PS1", request)
+
+        mock_client.rpost.assert_called_once_with(
+            "/schedules/PS1/overrides",
+            json={
+                "overrides": [
+                    {
+                        "start": "2025-01-01T09:00:00-05:00",
+                        "end": "2025-01-01T17:00:00-05:00",
+                        "user": {"id": "PU1", "type": "user_reference"},
+                    }
+                ]
+            },
+        )
+
+
 class TestCheckV3Response(unittest.TestCase):
     """The v3 error checker must surface the API's own message, not an opaque failure."""
 
@@ -1,10 +1,15 @@
+import asyncio
+import inspect
+import threading
 import unittest
 import unittest.mock
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
-from pagerduty_mcp.server import Transport, app
+from pagerduty_mcp.cache import record_stale_read
+from pagerduty_mcp.models import ListResponseModel, Team
+from pagerduty_mcp.server import Transport, app, run_in_worker_thread
 from pagerduty_mcp.tools import read_tools, write_tools
 
 
@@ -270,5 +275,50 @@ class TestServerRun(unittest.TestCase):
         self.assertEqual(mock_mcp.add_tool.call_count, len(read_tools) + len(write_tools))
 
 
+class TestRunInWorkerThread(unittest.TestCase):
+    """Test cases for running blocking tools off the event loop."""
+
+    def test_wrapper_is_async_and_preserves_metadata(self):
+        def sample_tool(incident_id: str, limit: int | None = None) -> str:
+            """Sample tool docstring."""
+            return f"{incident_id}:{limit}"
+
+        wrapped = run_in_worker_thread(sample_tool)
+
+        self.assertTrue(inspect.iscoroutinefunction(wrapped))
+        self.assertEqual(wrapped.__name__, "sample_tool")
+        self.assertEqual(wrapped.__doc__, "Sample tool docstring.")
+        self.assertEqual(inspect.signature(wrapped), inspect.signature(sample_tool))
+
+    def test_wrapper_runs_tool_on_worker_thread(self):
+        main_thread = threading.get_ident()
+
+        def sample_tool(value: int) -> tuple[int, int]:
+            return value, threading.get_ident()
+
+        result, tool_thread = asyncio.run(run_in_worker_thread(sample_tool)(value=3))
+
+        self.assertEqual(result, 3)
+        self.assertNotEqual(tool_thread, main_thread)
+
+    def test_list_result_is_marked_stale_when_a_stale_read_was_served(self):
+        def sample_tool() -> ListResponseModel[Team]:
+            record_stale_read("https://api.pagerduty.com/teams")
+            return ListResponseModel[Team](response=[Team(name="Ops")])
+
+        result = asyncio.run(run_in_worker_thread(sample_tool)())
+
+        self.assertTrue(result.is_stale)
+        self.assertIn("served from an earlier cached result", result.response_summary)
+
+    def test_list_result_is_not_marked_stale_for_live_reads(self):
+        def sample_tool() -> ListResponseModel[Team]:
+            return ListResponseModel[Team](response=[Team(name="Ops")])
+
+        result = asyncio.run(run_in_worker_thread(sample_tool)())
+
+        self.assertFalse(result.is_stale)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,14 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-from pagerduty_mcp.models.base import DEFAULT_PAGINATION_LIMIT, MAXIMUM_PAGINATION_LIMIT
+from pagerduty_mcp.models.base import DEFAULT_PAGINATION_LIMIT, MAX_BULK_LOOKUP_IDS, MAXIMUM_PAGINATION_LIMIT
 from pagerduty_mcp.models.escalation_policies import EscalationPolicyReference
 from pagerduty_mcp.models.references import TeamReference
 from pagerduty_mcp.models.services import Service, ServiceCreate, ServiceQuery
 from pagerduty_mcp.tools.services import (
     create_service,
     get_service,
+    get_services_bulk,
     get_technical_service_dependencies,
     list_services,
     update_service,
@@ -73,29 +74,29 @@ class TestServiceTools(unittest.TestCase):
         self.mock_client.rpost.side_effect = None
         self.mock_client.rput.side_effect = None
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_no_query_model(self, mock_get_client, mock_paginate):
+    def test_list_services_no_query_model(self, mock_get_client, mock_iter_pages):
         """Test that list_services can be called with no arguments."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_services_list_response
+        mock_iter_pages.return_value = [self.sample_services_list_response]
 
         result = list_services()
 
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params={})
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params={})
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_no_filters(self, mock_get_client, mock_paginate):
+    def test_list_services_no_filters(self, mock_get_client, mock_iter_pages):
         """Test listing services without any filters."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_services_list_response
+        mock_iter_pages.return_value = [self.sample_services_list_response]
 
         result = list_services()
 
         # Verify paginate call
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params={})
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params={})
 
         self.assertEqual(len(result.response), 2)
         self.assertIsInstance(result.response[0], Service)
@@ -105,88 +106,88 @@ class TestServiceTools(unittest.TestCase):
         self.assertEqual(result.response[0].name, "Web Application Service")
         self.assertEqual(result.response[1].name, "Database Service")
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_with_query_filter(self, mock_get_client, mock_paginate):
+    def test_list_services_with_query_filter(self, mock_get_client, mock_iter_pages):
         """Test listing services with query filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_services_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_services_list_response[0]]]
 
         result = list_services(query="Web")
 
         # Verify paginate call
         expected_params = {"query": "Web"}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
 
         self.assertEqual(len(result.response), 1)
         self.assertEqual(result.response[0].name, "Web Application Service")
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_with_teams_filter(self, mock_get_client, mock_paginate):
+    def test_list_services_with_teams_filter(self, mock_get_client, mock_iter_pages):
         """Test listing services with teams filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_services_list_response[1]]
+        mock_iter_pages.return_value = [[self.sample_services_list_response[1]]]
 
         result = list_services(teams_ids=["TEAM2"])
 
         # Verify paginate call
         expected_params = {"team_ids[]": ["TEAM2"]}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
 
         self.assertEqual(len(result.response), 1)
         self.assertEqual(result.response[0].name, "Database Service")
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_with_custom_limit(self, mock_get_client, mock_paginate):
+    def test_list_services_with_custom_limit(self, mock_get_client, mock_iter_pages):
         """Test listing services with custom limit."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_services_list_response
+        mock_iter_pages.return_value = [self.sample_services_list_response]
 
         result = list_services(limit=50)
 
         expected_params = {"limit": 50}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
 
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_with_all_filters(self, mock_get_client, mock_paginate):
+    def test_list_services_with_all_filters(self, mock_get_client, mock_iter_pages):
         """Test listing services with all filters applied."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_services_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_services_list_response[0]]]
 
         result = list_services(query="Web", teams_ids=["TEAM1"], limit=10)
 
         expected_params = {"query": "Web", "team_ids[]": ["TEAM1"], "limit": 10}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
 
         self.assertEqual(len(result.response), 1)
         self.assertEqual(result.response[0].name, "Web Application Service")
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_empty_response(self, mock_get_client, mock_paginate):
+    def test_list_services_empty_response(self, mock_get_client, mock_iter_pages):
         """Test listing services when paginate returns empty list."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = []
+        mock_iter_pages.return_value = [[]]
 
         result = list_services(query="NonExistentService")
 
         # Verify paginate call
         expected_params = {"query": "NonExistentService"}
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
+        mock_iter_pages.assert_called_once_with(client=self.mock_client, entity="services", params=expected_params)
 
         self.assertEqual(len(result.response), 0)
 
-    @patch("pagerduty_mcp.tools.services.paginate")
+    @patch("pagerduty_mcp.tools.services.iter_pages")
     @patch("pagerduty_mcp.tools.services.get_client")
-    def test_list_services_paginate_error(self, mock_get_client, mock_paginate):
+    def test_list_services_paginate_error(self, mock_get_client, mock_iter_pages):
         """Test list_services when paginate raises an exception."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.side_effect = Exception("Pagination Error")
+        mock_iter_pages.side_effect = Exception("Pagination Error")
 
         with self.assertRaises(Exception) as context:
             list_services()
@@ -233,6 +234,47 @@ class TestServiceTools(unittest.TestCase):
         mock_get_client.assert_called_once()
         self.mock_client.rget.assert_called_once_with("/services/SVC123")
 
+    @patch("pagerduty_mcp.tools.services.get_client")
+    def test_get_services_bulk(self, mock_get_client):
+        """Test that get_services_bulk fetches each distinct service once, preserving order."""
+        mock_get_client.return_value = self.mock_client
+        self.mock_client.rget.side_effect = lambda path: {
+            **self.sample_service_response,
+            "id": path.rsplit("/", 1)[-1],
+        }
+
+        result = get_services_bulk(["SVC2", "SVC1", "SVC2"])
+
+        self.assertEqual([service.id for service in result.response], ["SVC2", "SVC1"])
+        self.assertEqual(self.mock_client.rget.call_count, 2)
+
+    @patch("pagerduty_mcp.tools.services.get_client")
+    def test_get_services_bulk_reports_failed_ids(self, mock_get_client):
+        """Test that a service that cannot be retrieved does not fail the others."""
+        mock_get_client.return_value = self.mock_client
+
+        def rget(path):
+            if path.endswith("/SVCMISSING"):
+                raise Exception("404 Not Found")
+            return {**self.sample_service_response, "id": path.rsplit("/", 1)[-1]}
+
+        self.mock_client.rget.side_effect = rget
+
+        result = get_services_bulk(["SVC1", "SVCMISSING"])
+
+        self.assertEqual([service.id for service in result.response], ["SVC1"])
+        self.assertEqual([(failure.id, failure.reason) for failure in result.failed], [("SVCMISSING", "404 Not Found")])
+
+    @patch("pagerduty_mcp.tools.services.get_client")
+    def test_get_services_bulk_caps_the_number_of_ids(self, mock_get_client):
+        """Test that too many service IDs are rejected before any request is made."""
+        mock_get_client.return_value = self.mock_client
+
+        with self.assertRaises(ValueError):
+            get_services_bulk([f"SVC{i}" for i in range(MAX_BULK_LOOKUP_IDS + 1)])
+
+        self.mock_client.rget.assert_not_called()
+
     @patch("pagerduty_mcp.tools.services.get_client")
     def test_create_service_success_wrapped_response(self, mock_get_client):
         """Test successful service creation with wrapped response."""
@@ -117,70 +117,70 @@ class TestStatusPagesTools(unittest.TestCase):
         }
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_pages_no_query_model(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_pages_no_query_model(self, mock_iter_pages, mock_get_client):
         """Test that list_status_pages can be called with no arguments (no query_model)."""
-        mock_paginate.return_value = [self.sample_status_page_data]
+        mock_iter_pages.return_value = [[self.sample_status_page_data]]
 
         result = list_status_pages()
 
-        mock_paginate.assert_called_once()
+        mock_iter_pages.assert_called_once()
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 1)
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_severities_no_query_model(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_severities_no_query_model(self, mock_iter_pages, mock_get_client):
         """Test that list_status_page_severities can be called without query_model."""
-        mock_paginate.return_value = [self.sample_severity_data]
+        mock_iter_pages.return_value = [[self.sample_severity_data]]
 
         result = list_status_page_severities("PQ8W0D0")
 
-        mock_paginate.assert_called_once()
+        mock_iter_pages.assert_called_once()
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 1)
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_impacts_no_query_model(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_impacts_no_query_model(self, mock_iter_pages, mock_get_client):
         """Test that list_status_page_impacts can be called without query_model."""
-        mock_paginate.return_value = [self.sample_impact_data]
+        mock_iter_pages.return_value = [[self.sample_impact_data]]
 
         result = list_status_page_impacts("PQ8W0D0")
 
-        mock_paginate.assert_called_once()
+        mock_iter_pages.assert_called_once()
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 1)
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_statuses_no_query_model(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_statuses_no_query_model(self, mock_iter_pages, mock_get_client):
         """Test that list_status_page_statuses can be called without query_model."""
-        mock_paginate.return_value = [self.sample_status_data]
+        mock_iter_pages.return_value = [[self.sample_status_data]]
 
         result = list_status_page_statuses("PQ8W0D0")
 
-        mock_paginate.assert_called_once()
+        mock_iter_pages.assert_called_once()
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 1)
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_post_updates_no_query_model(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_post_updates_no_query_model(self, mock_iter_pages, mock_get_client):
         """Test that list_status_page_post_updates can be called without query_model."""
-        mock_paginate.return_value = [self.sample_post_update_data]
+        mock_iter_pages.return_value = [[self.sample_post_update_data]]
 
         result = list_status_page_post_updates("PQ8W0D0", "PIJ90N7")
 
-        mock_paginate.assert_called_once()
+        mock_iter_pages.assert_called_once()
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 1)
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_pages_basic(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_pages_basic(self, mock_iter_pages, mock_get_client):
         """Test basic Status Pages listing."""
-        mock_paginate.return_value = [self.sample_status_page_data]
+        mock_iter_pages.return_value = [[self.sample_status_page_data]]
 
         query = StatusPageQuery()
         result = list_status_pages(query)
@@ -192,10 +192,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].name, "My brand Status Page")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_pages_filter_by_type(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_pages_filter_by_type(self, mock_iter_pages, mock_get_client):
         """Test Status Pages listing with type filter."""
-        mock_paginate.return_value = [self.sample_status_page_data]
+        mock_iter_pages.return_value = [[self.sample_status_page_data]]
 
         query = StatusPageQuery(status_page_type="private")
         result = list_status_pages(query)
@@ -205,10 +205,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].status_page_type, "private")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_severities_basic(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_severities_basic(self, mock_iter_pages, mock_get_client):
         """Test basic Severity listing."""
-        mock_paginate.return_value = [self.sample_severity_data]
+        mock_iter_pages.return_value = [[self.sample_severity_data]]
 
         query = StatusPageSeverityQuery()
         result = list_status_page_severities("PQ8W0D0", query)
@@ -220,10 +220,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].description, "all good")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_severities_filter_by_post_type(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_severities_filter_by_post_type(self, mock_iter_pages, mock_get_client):
         """Test Severity listing with post type filter."""
-        mock_paginate.return_value = [self.sample_severity_data]
+        mock_iter_pages.return_value = [[self.sample_severity_data]]
 
         query = StatusPageSeverityQuery(post_type="incident")
         result = list_status_page_severities("PQ8W0D0", query)
@@ -233,10 +233,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].post_type, "incident")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_impacts_basic(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_impacts_basic(self, mock_iter_pages, mock_get_client):
         """Test basic Impact listing."""
-        mock_paginate.return_value = [self.sample_impact_data]
+        mock_iter_pages.return_value = [[self.sample_impact_data]]
 
         query = StatusPageImpactQuery()
         result = list_status_page_impacts("PQ8W0D0", query)
@@ -248,10 +248,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].description, "operational")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_impacts_filter_by_post_type(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_impacts_filter_by_post_type(self, mock_iter_pages, mock_get_client):
         """Test Impact listing with post type filter."""
-        mock_paginate.return_value = [self.sample_impact_data]
+        mock_iter_pages.return_value = [[self.sample_impact_data]]
 
         query = StatusPageImpactQuery(post_type="incident")
         result = list_status_page_impacts("PQ8W0D0", query)
@@ -261,10 +261,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].post_type, "incident")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_statuses_basic(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_statuses_basic(self, mock_iter_pages, mock_get_client):
         """Test basic Status listing."""
-        mock_paginate.return_value = [self.sample_status_data]
+        mock_iter_pages.return_value = [[self.sample_status_data]]
 
         query = StatusPageStatusQuery()
         result = list_status_page_statuses("PQ8W0D0", query)
@@ -276,10 +276,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].description, "investigating")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_statuses_filter_by_post_type(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_statuses_filter_by_post_type(self, mock_iter_pages, mock_get_client):
         """Test Status listing with post type filter."""
-        mock_paginate.return_value = [self.sample_status_data]
+        mock_iter_pages.return_value = [[self.sample_status_data]]
 
         query = StatusPageStatusQuery(post_type="incident")
         result = list_status_page_statuses("PQ8W0D0", query)
@@ -454,10 +454,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.id, "PXSOCH0")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_post_updates_basic(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_post_updates_basic(self, mock_iter_pages, mock_get_client):
         """Test basic Post Update listing."""
-        mock_paginate.return_value = [self.sample_post_update_data]
+        mock_iter_pages.return_value = [[self.sample_post_update_data]]
 
         query = StatusPagePostUpdateQuery()
         result = list_status_page_post_updates("PR5LMML", "PIJ90N7", query)
@@ -468,10 +468,10 @@ class TestStatusPagesTools(unittest.TestCase):
         self.assertEqual(result.response[0].id, "PXSOCH0")
 
     @patch("pagerduty_mcp.tools.status_pages.get_client")
-    @patch("pagerduty_mcp.tools.status_pages.paginate")
-    def test_list_status_page_post_updates_filter_by_reviewed_status(self, mock_paginate, mock_get_client):
+    @patch("pagerduty_mcp.tools.status_pages.iter_pages")
+    def test_list_status_page_post_updates_filter_by_reviewed_status(self, mock_iter_pages, mock_get_client):
         """Test Post Update listing with reviewed status filter."""
-        mock_paginate.return_value = [self.sample_post_update_data]
+        mock_iter_pages.return_value = [[self.sample_post_update_data]]
 
         query = StatusPagePostUpdateQuery(reviewed_status="approved")
         result = list_status_page_post_updates("PR5LMML", "PIJ90N7", query)
@@ -7,13 +7,16 @@ from pagerduty_mcp.models.references import UserReference
 from pagerduty_mcp.models.teams import Team, TeamCreate, TeamCreateRequest, TeamMemberAdd, TeamQuery
 from pagerduty_mcp.models.users import User
 from pagerduty_mcp.tools.teams import (
+    MAX_TEAM_MEMBER_CHANGES,
     add_team_member,
+    add_team_members_bulk,
     create_team,
     delete_team,
     get_team,
     list_team_members,
     list_teams,
     remove_team_member,
+    remove_team_members_bulk,
     update_team,
 )
 from tests.mock_context_strategy import MockContextStrategy
@@ -74,25 +77,27 @@ class TestTeamTools(unittest.TestCase):
         self.mock_strategy.context.client = self.mock_client
         ContextResolver.set_strategy(self.mock_strategy)
 
-    @patch("pagerduty_mcp.tools.teams.paginate")
-    def test_list_teams_no_query_model(self, mock_paginate):
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
+    def test_list_teams_no_query_model(self, mock_iter_pages):
         """Test that list_teams can be called with no arguments (no query_model), defaults to 'all' scope."""
-        mock_paginate.return_value = self.sample_teams_list_response
+        mock_iter_pages.return_value = [self.sample_teams_list_response]
 
         result = list_teams()
 
-        mock_paginate.assert_called_once()
+        mock_iter_pages.assert_called_once()
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.teams.paginate")
-    def test_list_teams_all_scope(self, mock_paginate):
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
+    def test_list_teams_all_scope(self, mock_iter_pages):
         """Test listing teams with 'all' scope."""
-        mock_paginate.return_value = self.sample_teams_list_response
+        mock_iter_pages.return_value = [self.sample_teams_list_response]
 
         result = list_teams(scope="all")
 
         # Verify paginate call
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="teams", params={}, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="teams", params={}, maximum_records=1000
+        )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
@@ -103,16 +108,75 @@ class TestTeamTools(unittest.TestCase):
         self.assertEqual(result.response[0].name, "Backend Engineering")
         self.assertEqual(result.response[1].name, "DevOps")
 
-    @patch("pagerduty_mcp.tools.teams.paginate")
-    def test_list_teams_my_scope(self, mock_paginate):
-        """Test listing teams with 'my' scope."""
-        mock_paginate.return_value = self.sample_teams_list_response
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
+    def test_list_teams_my_scope(self, mock_iter_pages):
+        """Test listing teams with 'my' scope reads the teams embedded in /users/me."""
+        embedded_teams = [
+            self.sample_team_response,
+            {"id": "TEAM789", "summary": "QA Team", "name": "QA", "type": "team"},
+        ]
+        self.mock_client.rget.return_value = {**self.sample_user_data, "teams": embedded_teams}
         self.mock_strategy.context.user = User.model_validate(self.sample_user_data)
 
         result = list_teams(scope="my")
 
+        # Verify a single request is made, without fetching teams one by one or scanning all teams
+        mock_iter_pages.assert_not_called()
+        self.mock_client.rget.assert_called_once_with("/users/me", params={"include[]": ["teams"]})
+
+        self.assertEqual(len(result.response), 2)
+        self.assertEqual(result.response[0].id, "TEAM123")
+        self.assertEqual(result.response[0].name, "Backend Engineering")
+        self.assertEqual(result.response[1].id, "TEAM789")
+
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
+    def test_list_teams_my_scope_references_only(self, mock_iter_pages):
+        """Test listing teams with 'my' scope fetches each team when /users/me only returns references."""
+        teams_by_id = {
+            "TEAM123": self.sample_team_response,
+            "TEAM789": {"id": "TEAM789", "summary": "QA Team", "name": "QA", "type": "team"},
+        }
+
+        def rget(path, params=None):
+            if path == "/users/me":
+                return self.sample_user_data
+            return teams_by_id[path.rsplit("/", 1)[-1]]
+
+        self.mock_client.rget.side_effect = rget
+        self.mock_strategy.context.user = User.model_validate(self.sample_user_data)
+
+        result = list_teams(scope="my")
+
+        # Verify each of the user's teams is fetched, without scanning all teams
+        mock_iter_pages.assert_not_called()
+        self.assertEqual(self.mock_client.rget.call_count, 3)
+        self.mock_client.rget.assert_any_call("/teams/TEAM123")
+        self.mock_client.rget.assert_any_call("/teams/TEAM789")
+
+        # Verify result keeps the order of the user's teams
+        self.assertEqual(len(result.response), 2)
+        self.assertEqual(result.response[0].id, "TEAM123")
+        self.assertEqual(result.response[0].name, "Backend Engineering")
+        self.assertEqual(result.response[1].id, "TEAM789")
+
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
+    def test_list_teams_my_scope_many_teams(self, mock_iter_pages):
+        """Test listing teams with 'my' scope scans all teams when the user has many memberships."""
+        mock_iter_pages.return_value = [self.sample_teams_list_response]
+        user_data = dict(self.sample_user_data)
+        user_data["teams"] = [
+            {"id": f"TEAMX{i}", "summary": f"Team {i}", "type": "team_reference"} for i in range(30)
+        ] + [{"id": "TEAM123", "summary": "Engineering Team - Backend Services", "type": "team_reference"}]
+        self.mock_client.rget.return_value = user_data
+        self.mock_strategy.context.user = User.model_validate(user_data)
+
+        result = list_teams(scope="my")
+
         # Verify paginate call to get all teams
-        mock_paginate.assert_called_once_with(client=self.mock_client, entity="teams", params={}, maximum_records=1000)
+        mock_iter_pages.assert_called_once_with(
+            client=self.mock_client, entity="teams", params={}, maximum_records=1000
+        )
+        self.mock_client.rget.assert_called_once_with("/users/me", params={"include[]": ["teams"]})
 
         # Verify result - should only include teams user is member of
         self.assertEqual(len(result.response), 1)  # Only TEAM123 matches user's teams
@@ -128,18 +192,18 @@ class TestTeamTools(unittest.TestCase):
 
         self.assertIn("Cannot fetch 'my' teams", str(context.exception))
 
-    @patch("pagerduty_mcp.tools.teams.paginate")
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
     @patch("pagerduty_mcp.tools.teams.get_client")
-    def test_list_teams_with_query_filter(self, mock_get_client, mock_paginate):
+    def test_list_teams_with_query_filter(self, mock_get_client, mock_iter_pages):
         """Test listing teams with query filter."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = [self.sample_teams_list_response[0]]
+        mock_iter_pages.return_value = [[self.sample_teams_list_response[0]]]
 
         result = list_teams(query="Backend", scope="all")
 
         # Verify paginate call
         expected_params = {"query": "Backend"}
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="teams", params=expected_params, maximum_records=1000
         )
 
@@ -147,36 +211,36 @@ class TestTeamTools(unittest.TestCase):
         self.assertEqual(len(result.response), 1)
         self.assertEqual(result.response[0].name, "Backend Engineering")
 
-    @patch("pagerduty_mcp.tools.teams.paginate")
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
     @patch("pagerduty_mcp.tools.teams.get_client")
-    def test_list_teams_with_custom_limit(self, mock_get_client, mock_paginate):
+    def test_list_teams_with_custom_limit(self, mock_get_client, mock_iter_pages):
         """Test listing teams with custom limit."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = self.sample_teams_list_response
+        mock_iter_pages.return_value = [self.sample_teams_list_response]
 
         result = list_teams(limit=50, scope="all")
 
         # Verify paginate call
         expected_params = {"limit": 50}
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="teams", params=expected_params, maximum_records=50
         )
 
         # Verify result
         self.assertEqual(len(result.response), 2)
 
-    @patch("pagerduty_mcp.tools.teams.paginate")
+    @patch("pagerduty_mcp.tools.teams.iter_pages")
     @patch("pagerduty_mcp.tools.teams.get_client")
-    def test_list_teams_empty_response(self, mock_get_client, mock_paginate):
+    def test_list_teams_empty_response(self, mock_get_client, mock_iter_pages):
         """Test listing teams when paginate returns empty list."""
         mock_get_client.return_value = self.mock_client
-        mock_paginate.return_value = []
+        mock_iter_pages.return_value = [[]]
 
         result = list_teams(query="NonExistentTeam", scope="all")
 
         # Verify paginate call
         expected_params = {"query": "NonExistentTeam"}
-        mock_paginate.assert_called_once_with(
+        mock_iter_pages.assert_called_once_with(
             client=self.mock_client, entity="teams", params=expected_params, maximum_records=1000
         )
 
@@ -505,6 +569,63 @@ class TestTeamTools(unittest.TestCase):
         mock_get_client.assert_called_once()
         self.mock_client.rdelete.assert_called_once_with("/teams/TEAM123/users/USER789")
 
+    @patch("pagerduty_mcp.tools.teams.get_client")
+    def test_add_team_members_bulk_reports_each_user(self, mock_get_client):
+        """Test bulk addition reports successes and failures per user."""
+        mock_get_client.return_value = self.mock_client
+        ok_response = MagicMock(ok=True)
+        not_found_response = MagicMock(ok=False, status_code=404, reason="Not Found")
+        self.mock_client.put.side_effect = lambda url, json: (
+            not_found_response if url.endswith("/USER2") else ok_response
+        )
+
+        members = [
+            TeamMemberAdd(user_id="USER1", role="responder"),
+            TeamMemberAdd(user_id="USER2", role="manager"),
+            TeamMemberAdd(user_id="USER3", role="observer"),
+        ]
+        result = add_team_members_bulk("TEAM123", members)
+
+        self.assertEqual(self.mock_client.put.call_count, 3)
+        self.mock_client.put.assert_any_call("/teams/TEAM123/users/USER1", json={"role": "responder"})
+        self.mock_client.put.assert_any_call("/teams/TEAM123/users/USER3", json={"role": "observer"})
+        self.assertEqual(result.successful, ["USER1", "USER3"])
+        self.assertEqual(len(result.failed), 1)
+        self.assertEqual(result.failed[0].user_id, "USER2")
+        self.assertEqual(result.failed[0].reason, "404 Not Found")
+
+    @patch("pagerduty_mcp.tools.teams.get_client")
+    def test_remove_team_members_bulk_collects_exceptions(self, mock_get_client):
+        """Test bulk removal reports a raised error as a failure instead of raising."""
+        mock_get_client.return_value = self.mock_client
+
+        def delete(url):
+            if url.endswith("/USER2"):
+                raise Exception("Connection reset")
+            return MagicMock(ok=True)
+
+        self.mock_client.delete.side_effect = delete
+
+        result = remove_team_members_bulk("TEAM123", ["USER1", "USER2", "USER1"])
+
+        self.assertEqual(self.mock_client.delete.call_count, 2)
+        self.assertEqual(result.successful, ["USER1"])
+        self.assertEqual([(f.user_id, f.reason) for f in result.failed], [("USER2", "Connection reset")])
+
+    @patch("pagerduty_mcp.tools.teams.get_client")
+    def test_team_members_bulk_caps_the_number_of_users(self, mock_get_client):
+        """Test that too many users are rejected before any membership request is sent."""
+        mock_get_client.return_value = self.mock_client
+        user_ids = [f"USER{i}" for i in range(MAX_TEAM_MEMBER_CHANGES + 1)]
+
+        with self.assertRaises(ValueError):
+            add_team_members_bulk("TEAM123", [TeamMemberAdd(user_id=user_id) for user_id in user_ids])
+        with self.assertRaises(ValueError):
+            remove_team_members_bulk("TEAM123", user_ids)
+
+        self.mock_client.put.assert_not_called()
+        self.mock_client.delete.assert_not_called()
+
     def test_team_query_to_params_all_fields(self):
         """Test TeamQuery.to_params() with all fields set."""
         query = TeamQuery(scope="all", query="test team", limit=25)
@@ -0,0 +1,215 @@
+import threading
+import unittest
+from contextvars import ContextVar
+from unittest.mock import MagicMock, patch
+
+from pagerduty import RestApiV2Client
+
+from pagerduty_mcp.models import Team
+from pagerduty_mcp.utils import (
+    MAX_CONCURRENT_REQUESTS,
+    enveloped_entity_adapter,
+    iter_pages,
+    paginate,
+    run_concurrently,
+)
+
+
+def make_classic_pagination_get(records, wrapper="incidents", *, include_total=True):
+    """Build a fake client.get that serves records with PagerDuty classic pagination."""
+
+    def get(url, params):
+        offset, limit = params["offset"], min(params["limit"], 100)
+        body = {wrapper: records[offset : offset + limit], "more": offset + limit < len(records)}
+        if include_total and params.get("total") == "true":
+            body["total"] = len(records)
+        return MagicMock(ok=True, status_code=200, json=MagicMock(return_value=body))
+
+    return get
+
+
+class TestPaginate(unittest.TestCase):
+    """Test cases for the paginate helper."""
+
+    def setUp(self):
+        self.client = RestApiV2Client("test_api_key")
+        self.records = [{"id": f"P{i}"} for i in range(250)]
+        patcher = patch.object(self.client, "get", side_effect=make_classic_pagination_get(self.records))
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def requested_offsets(self):
+        return [call.kwargs["params"]["offset"] for call in self.mock_get.call_args_list]
+
+    def test_paginate_stops_at_maximum_records(self):
+        """Test that pagination stops once the maximum number of records is reached."""
+        result = paginate(client=self.client, entity="incidents", params={}, maximum_records=120)
+
+        self.assertEqual(result, self.records[:120])
+        self.assertEqual(sorted(self.requested_offsets()), [0, 100])
+
+    def test_paginate_returns_all_records_below_maximum(self):
+        """Test that all records are returned, in order, when fewer than the maximum exist."""
+        result = paginate(client=self.client, entity="incidents", params={})
+
+        self.assertEqual(result, self.records)
+        self.assertEqual(sorted(self.requested_offsets()), [0, 100, 200])
+
+    def test_paginate_requests_total_on_first_page_only(self):
+        """Test that only the first page asks for the total used to plan the remaining pages."""
+        paginate(client=self.client, entity="incidents", params={"statuses[]": ["triggered"]})
+
+        first_params = self.mock_get.call_args_list[0].kwargs["params"]
+        self.assertEqual(first_params, {"limit": 100, "statuses[]": ["triggered"], "offset": 0, "total": "true"})
+        for call in self.mock_get.call_args_list[1:]:
+            self.assertNotIn("total", call.kwargs["params"])
+
+    def test_paginate_fetches_remaining_pages_concurrently(self):
+        """Test that pages after the first are fetched on worker threads."""
+        main_thread = threading.get_ident()
+        threads = []
+        serve = make_classic_pagination_get(self.records)
+
+        def get(url, params):
+            threads.append(threading.get_ident())
+            return serve(url, params)
+
+        self.mock_get.side_effect = get
+
+        paginate(client=self.client, entity="incidents", params={})
+
+        self.assertEqual(threads[0], main_thread)
+        self.assertTrue(all(thread != main_thread for thread in threads[1:]))
+
+    def test_paginate_without_total_continues_sequentially(self):
+        """Test that pages are still all fetched when the endpoint does not report a total."""
+        self.mock_get.side_effect = make_classic_pagination_get(self.records, include_total=False)
+
+        result = paginate(client=self.client, entity="incidents", params={})
+
+        self.assertEqual(result, self.records)
+
+    def test_paginate_caps_page_size_at_maximum_records(self):
+        """Test that small requests do not fetch a full default-sized page."""
+        result = paginate(
+            client=self.client, entity="incidents", params={"statuses[]": ["triggered"]}, maximum_records=5
+        )
+
+        self.assertEqual(result, self.records[:5])
+        self.mock_get.assert_called_once()
+        self.assertEqual(self.mock_get.call_args.kwargs["params"]["limit"], 5)
+
+    def test_paginate_with_no_records_requested(self):
+        """Test that the API is not called when no records are requested."""
+        for maximum_records in (0, -1):
+            result = paginate(client=self.client, entity="incidents", params={}, maximum_records=maximum_records)
+
+            self.assertEqual(result, [])
+        self.mock_get.assert_not_called()
+
+
+class TestIterPages(unittest.TestCase):
+    """Test cases for the iter_pages helper."""
+
+    def setUp(self):
+        self.client = RestApiV2Client("test_api_key")
+        self.records = [{"id": f"P{i}"} for i in range(250)]
+        patcher = patch.object(self.client, "get", side_effect=make_classic_pagination_get(self.records))
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_iter_pages_yields_records_in_pages(self):
+        """Test that records are grouped into pages of at most the page size."""
+        pages = list(iter_pages(client=self.client, entity="incidents", params={}, maximum_records=250))
+
+        self.assertEqual([len(page) for page in pages], [100, 100, 50])
+        self.assertEqual([record for page in pages for record in page], self.records)
+
+    def test_iter_pages_stops_at_maximum_records(self):
+        """Test that no more than the maximum number of records are yielded."""
+        pages = list(iter_pages(client=self.client, entity="incidents", params={}, maximum_records=120))
+
+        self.assertEqual([record for page in pages for record in page], self.records[:120])
+
+    def test_iter_pages_fetches_pages_in_concurrent_batches(self):
+        """Test that later pages are fetched in batches of at most MAX_CONCURRENT_REQUESTS."""
+        records = [{"id": f"P{i}"} for i in range(1000)]
+        self.mock_get.side_effect = make_classic_pagination_get(records)
+
+        pages = iter_pages(client=self.client, entity="incidents", params={}, maximum_records=1000)
+        next(pages)
+        next(pages)
+
+        # The first page, then one batch of pages fetched together.
+        self.assertEqual(self.mock_get.call_count, 1 + MAX_CONCURRENT_REQUESTS)
+        self.assertEqual([record for page in pages for record in page], records[200:])
+        self.assertEqual(self.mock_get.call_count, 10)
+
+    def test_iter_pages_with_no_records_requested(self):
+        """Test that the API is not called when no records are requested."""
+        pages = list(iter_pages(client=self.client, entity="incidents", params={}, maximum_records=0))
+
+        self.assertEqual(pages, [])
+        self.mock_get.assert_not_called()
+
+
+class TestRunConcurrently(unittest.TestCase):
+    """Test cases for the run_concurrently helper."""
+
+    def test_results_preserve_item_order(self):
+        """Test that results are returned in the same order as the items."""
+        result = run_concurrently(lambda item: item * 2, [3, 1, 2])
+
+        self.assertEqual(result, [6, 2, 4])
+
+    def test_calls_see_the_callers_context(self):
+        """Test that each call runs in a copy of the caller's context."""
+        request_id: ContextVar[str] = ContextVar("request_id")
+        request_id.set("REQ123")
+
+        result = run_concurrently(lambda _: request_id.get(), range(3))
+
+        self.assertEqual(result, ["REQ123"] * 3)
+
+    def test_runs_calls_on_worker_threads(self):
+        """Test that multiple items are processed off the calling thread."""
+        main_thread = threading.get_ident()
+
+        result = run_concurrently(lambda _: threading.get_ident(), range(3))
+
+        self.assertNotIn(main_thread, result)
+
+    def test_propagates_exceptions(self):
+        """Test that an error raised by any call is re-raised to the caller."""
+
+        def fail_on_two(item):
+            if item == 2:
+                raise ValueError("boom")
+            return item
+
+        with self.assertRaises(ValueError):
+            run_concurrently(fail_on_two, [1, 2, 3])
+
+
+class TestEnvelopedEntityAdapter(unittest.TestCase):
+    """Test cases for the enveloped_entity_adapter helper."""
+
+    def setUp(self):
+        self.adapter = enveloped_entity_adapter(Team, "team")
+        self.team_data = {"id": "PTEAM1", "name": "Ops"}
+
+    def test_validates_bare_entity(self):
+        """Test that an unwrapped entity is validated directly."""
+        team = self.adapter.validate_python(self.team_data)
+
+        self.assertEqual(team, Team(id="PTEAM1", name="Ops"))
+
+    def test_validates_wrapped_entity(self):
+        """Test that an entity inside its envelope is unwrapped and validated."""
+        team = self.adapter.validate_python({"team": self.team_data})
+
+        self.assertEqual(team, Team(id="PTEAM1", name="Ops"))
+
+
+if __name__ == "__main__":
+    unittest.main()